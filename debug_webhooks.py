@@ -4,12 +4,29 @@ Debug webhook URLs in production environment
 """
 import os
 import sys
-import requests
-from src.config import config
+import time
 import re
 
-def validate_webhook_url(url, name):
-    """Test webhook URL format and connectivity"""
+# requests and src.config are imported lazily so importing this module
+# stays cheap and doesn't load .env or validate webhooks as a side effect
+
+_DISCORD_RE = re.compile(r'^https://discord\.com/api/webhooks/\d+/[\w\-]+$')
+
+_session = None
+
+def _get_session():
+    """Shared session so every webhook test reuses pooled keep-alive connections to discord.com"""
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        _session = requests.Session()
+        _session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0))
+    return _session
+
+def check_webhook_format(url, name):
+    """Check webhook URL format before it is queued for a connectivity test"""
     print(f"\n=== Testing {name} ===")
     
     if not url:
@@ -21,14 +38,24 @@ def validate_webhook_url(url, name):
     print(f"🔗 Last 50 chars: ...{url[-50:]}")
     
     # Check format
-    discord_pattern = r'^https://discord\.com/api/webhooks/\d+/[\w\-]+$'
-    if not re.match(discord_pattern, url):
+    if not _DISCORD_RE.match(url):
         print(f"❌ {name}: Invalid Discord webhook format")
         return False
     else:
         print(f"✅ {name}: Valid Discord webhook format")
     
-    # Test connectivity
+    return True
+
+def send_test_payload(url, name):
+    """
+    Send a test payload to a webhook.
+    
+    Returns a (success, report_lines) tuple so results can be printed in
+    order once all concurrent tests have finished.
+    """
+    import requests
+    
+    session = _get_session()
     try:
         # Send a test payload
         test_payload = {
@@ -52,21 +79,35 @@ def validate_webhook_url(url, name):
             }]
         }
         
-        response = requests.post(url, json=test_payload, timeout=10)
+        response = session.post(url, json=test_payload, timeout=10)
+        
+        # Honor Discord's rate limit: wait the requested time and retry once
+        if response.status_code == 429:
+            try:
+                retry_after = float(response.json().get('retry_after', 1))
+            except (ValueError, AttributeError, TypeError):
+                try:
+                    retry_after = float(response.headers.get('Retry-After', 1))
+                except ValueError:
+                    retry_after = 1.0
+            time.sleep(retry_after)
+            response = session.post(url, json=test_payload, timeout=10)
         
         if response.status_code == 204:
-            print(f"✅ {name}: Webhook test successful (204)")
-            return True
+            return True, [f"✅ {name}: Webhook test successful (204)"]
         else:
-            print(f"❌ {name}: Webhook failed with status {response.status_code}")
-            print(f"   Response: {response.text[:200]}")
-            return False
+            return False, [
+                f"❌ {name}: Webhook failed with status {response.status_code}",
+                f"   Response: {response.text[:200]}"
+            ]
             
     except requests.exceptions.RequestException as e:
-        print(f"❌ {name}: Connection error - {e}")
-        return False
+        return False, [f"❌ {name}: Connection error - {e}"]
 
 def main():
+    from concurrent.futures import ThreadPoolExecutor
+    from src.config import config
+    
     print("🔍 Discord Webhook Diagnostics")
     print("=" * 50)
     
@@ -74,22 +115,34 @@ def main():
     print(f"Environment: {'Railway' if os.getenv('RAILWAY_ENVIRONMENT') else 'Local'}")
     print(f"Python version: {sys.version}")
     
-    # Test main webhook
-    main_success = validate_webhook_url(config.discord_webhook_url, "Main Webhook")
+    # Main webhook plus every configured city webhook
+    webhooks = [("Main Webhook", config.discord_webhook_url)]
+    webhooks += [(f"{city} Webhook", url) for city, url in config.discord_webhook_urls.items() if url]
+    
+    # Format checks are cheap and run synchronously; only well-formed
+    # webhooks are queued for the (network-bound) connectivity test
+    results = {name: False for name, _ in webhooks}
+    queued = [(name, url) for name, url in webhooks if check_webhook_format(url, name)]
     
-    # Test city webhooks
-    city_results = {}
-    for city, url in config.discord_webhook_urls.items():
-        if url:
-            city_results[city] = validate_webhook_url(url, f"{city} Webhook")
+    # Test all webhooks concurrently so total time is ~1 round trip, not N
+    if queued:
+        print(f"\n📡 Sending {len(queued)} test payloads concurrently...")
+        with ThreadPoolExecutor(max_workers=len(queued)) as executor:
+            futures = {name: executor.submit(send_test_payload, url, name) for name, url in queued}
+        
+        for name, _ in queued:
+            success, report = futures[name].result()
+            results[name] = success
+            for line in report:
+                print(line)
     
     # Summary
     print("\n" + "=" * 50)
     print("📊 SUMMARY")
     print("=" * 50)
     
-    total_webhooks = 1 + len([url for url in config.discord_webhook_urls.values() if url])
-    successful_webhooks = int(main_success) + sum(city_results.values())
+    total_webhooks = len(webhooks)
+    successful_webhooks = sum(results.values())
     
     print(f"Total webhooks configured: {total_webhooks}")
     print(f"Successful webhooks: {successful_webhooks}")
@@ -0,0 +1,34 @@
+"""
+Gunicorn configuration for the Railway web worker
+
+Serves the Flask app with a threaded worker so /health and /status are
+answered concurrently with other requests, and starts the job monitor and
+scheduler inside that worker once it has loaded the app.
+"""
+import os
+import sys
+
+from gunicorn.arbiter import Arbiter
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8080')}"
+
+# A single worker process: the scheduler and the last-search state live in
+# process memory, so every request must be served by the process running them
+workers = 1
+worker_class = 'gthread'
+threads = 4
+timeout = 120
+
+def post_worker_init(worker):
+    """Start the monitor and scheduler in the freshly booted worker"""
+    import railway_web_worker
+    
+    if not railway_web_worker.start_background_services():
+        # Tell the arbiter this worker can't boot instead of respawning it forever
+        sys.exit(Arbiter.WORKER_BOOT_ERROR)
+
+def worker_exit(server, worker):
+    """Stop the scheduler (and release the monitor) when the worker shuts down"""
+    import railway_web_worker
+    
+    railway_web_worker.stop_background_services()
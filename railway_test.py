@@ -12,13 +12,37 @@ from datetime import datetime
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Both tests share one monitor so the DB and HTTP setup only happens once
+_monitor = None
+
+def get_monitor():
+    """Return the shared LinkedInJobMonitor, creating it on first use"""
+    global _monitor
+    if _monitor is None:
+        from src.linkedin_monitor import LinkedInJobMonitor
+        _monitor = LinkedInJobMonitor()
+    return _monitor
+
 def test_railway_environment():
     """Test Railway environment and configuration"""
     logger.info("🚀 RAILWAY ENVIRONMENT TEST")
     logger.info("=" * 50)
     
+    env_vars = [
+        'DISCORD_WEBHOOK_URL',
+        'DISCORD_WEBHOOK_URL_NYC', 
+        'DISCORD_WEBHOOK_URL_LA',
+        'DISCORD_WEBHOOK_URL_SF',
+        'DISCORD_WEBHOOK_URL_SD',
+        'JOB_TITLE',
+        'CITIES'
+    ]
+    
+    # Read the environment once up front
+    env_snapshot = {var: os.environ.get(var) for var in env_vars + ['RAILWAY_ENVIRONMENT']}
+    
     # Check if we're on Railway
-    railway_env = os.getenv('RAILWAY_ENVIRONMENT')
+    railway_env = env_snapshot['RAILWAY_ENVIRONMENT']
     if railway_env:
         logger.info(f"✅ Running on Railway environment: {railway_env}")
     else:
@@ -33,19 +57,9 @@ def test_railway_environment():
     
     # Test environment variables
     logger.info("🔐 Checking environment variables...")
-    env_vars = [
-        'DISCORD_WEBHOOK_URL',
-        'DISCORD_WEBHOOK_URL_NYC', 
-        'DISCORD_WEBHOOK_URL_LA',
-        'DISCORD_WEBHOOK_URL_SF',
-        'DISCORD_WEBHOOK_URL_SD',
-        'JOB_TITLE',
-        'CITIES'
-    ]
-    
     missing_vars = []
     for var in env_vars:
-        value = os.getenv(var)
+        value = env_snapshot[var]
         if value:
             # Show first/last few characters for security
             masked = f"{value[:10]}...{value[-10:]}" if len(value) > 20 else value
@@ -61,9 +75,8 @@ def test_railway_environment():
     # Test imports
     logger.info("📦 Testing imports...")
     try:
-        sys.path.insert(0, 'src')
-        from linkedin_monitor import LinkedInJobMonitor
-        from config import config
+        from src.linkedin_monitor import LinkedInJobMonitor
+        from src.config import config
         logger.info("✅ All imports successful")
     except Exception as e:
         logger.error(f"❌ Import failed: {e}")
@@ -72,7 +85,7 @@ def test_railway_environment():
     # Test Discord webhook
     logger.info("🔔 Testing Discord notification...")
     try:
-        monitor = LinkedInJobMonitor()
+        monitor = get_monitor()
         success = monitor.discord.notify_status(
             "Railway Test", 
             f"Railway worker process is running! Time: {now.strftime('%H:%M:%S')}", 
@@ -91,25 +104,31 @@ def test_railway_environment():
     return True
 
 def test_job_search():
-    """Test a quick job search"""
+    """Test a quick job search in every configured city"""
     logger.info("🔍 Testing job search...")
     try:
-        sys.path.insert(0, 'src')
-        from linkedin_monitor import LinkedInJobMonitor
-        
-        monitor = LinkedInJobMonitor()
+        monitor = get_monitor()
         if not monitor.initialize():
             logger.error("❌ Monitor initialization failed")
             return False
         
-        # Test with one city
-        success, jobs = monitor.extract_jobs_http('NYC')
-        logger.info(f"Job search result: {len(jobs)} jobs found")
+        # Same concurrent search the monitor runs, minus the database writes,
+        # so jobs found here are still notified by the next real run
+        cities = list(monitor.config.cities)
+        results = monitor.search_cities(cities)
+        
+        all_ok = True
+        for city, (success, jobs, _, error_message) in zip(cities, results):
+            if not success:
+                logger.error(f"❌ {city}: search failed - {error_message}")
+                all_ok = False
+                continue
         
-        for i, job in enumerate(jobs[:3]):
-            logger.info(f"  {i+1}. {job.title} at {job.company}")
+            logger.info(f"{city} job search result: {len(jobs)} jobs found")
+            for i, job in enumerate(jobs[:3]):
+                logger.info(f"  {i+1}. {job.title} at {job.company}")
         
-        return True
+        return all_ok
         
     except Exception as e:
         logger.error(f"❌ Job search test failed: {e}")
@@ -5,46 +5,113 @@ Combines web server (for Railway) with background job scheduler
 """
 import os
 import sys
+import atexit
 import time
+import queue
 import logging
 import threading
-from datetime import datetime, timedelta
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from datetime import datetime, timedelta, timezone
+import orjson
 from flask import Flask, jsonify
+from flask.json.provider import JSONProvider
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.executors.pool import ThreadPoolExecutor
+from apscheduler.events import EVENT_SCHEDULER_SHUTDOWN
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.cron import CronTrigger
 
-# Add src directory to path
-sys.path.insert(0, 'src')
+from src.linkedin_monitor import LinkedInJobMonitor
+from src.runner import run_search_cycle
+from src.config import config
 
-from linkedin_monitor import LinkedInJobMonitor
-from config import config
+# Setup logging for Railway - the file log is size-capped so it can't fill the ephemeral disk.
+# Records are handed to a background listener through a queue, so scheduler and
+# request threads never block on a slow stdout pipe or disk write.
+os.makedirs(os.path.dirname(config.log_file) or '.', exist_ok=True)
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+log_handlers = [
+    logging.StreamHandler(),
+    RotatingFileHandler(config.log_file, maxBytes=10_000_000, backupCount=3)
+]
+for handler in log_handlers:
+    handler.setFormatter(log_formatter)
 
-# Setup logging for Railway
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[logging.StreamHandler()]
-)
+log_queue = queue.Queue(-1)
+root_logger = logging.getLogger()
+root_logger.setLevel(logging.INFO)
+root_logger.addHandler(QueueHandler(log_queue))
+log_listener = QueueListener(log_queue, *log_handlers, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
 
 logger = logging.getLogger(__name__)
 
+# Monotonic reference for /health uptime
+_PROCESS_START = time.monotonic()
+
+# Monitoring targets are fixed for the life of the process - read them once
+CITIES = list(config.cities)
+CITIES_DISPLAY = ', '.join(CITIES)
+JOB_TITLE = config.job_title
+
+# Deployment environment doesn't change at runtime either
+RAILWAY_ENV = os.getenv('RAILWAY_ENVIRONMENT', 'local')
+
 # Global variables
 app = Flask(__name__)
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, which also encodes datetimes natively."""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+app.json = ORJSONProvider(app)
 job_monitor = None
 scheduler = None
-last_search_time = None
-last_search_result = None
+
+# (last search start time, last search result) - always replaced as a whole
+# tuple so request threads never see a time from one search paired with the
+# result of another
+_last = (None, None)
+
+# Start time of the most recent search, set as soon as it begins; drives the
+# /trigger rate limit and in-progress reporting while _last still holds the
+# previous search
+_search_started = None
+
+# Held for the duration of a search so a manual /trigger and a scheduled
+# run can never overlap on the shared monitor
+search_lock = threading.Lock()
+
+# How long shutdown waits for an in-flight search before leaving the
+# monitor's resources open rather than closing them under it
+SHUTDOWN_LOCK_TIMEOUT = 5.0
+
+# Adaptive polling: after several empty searches in a row, scheduled ticks
+# are skipped (and the next search window widened to cover them)
+EMPTY_SEARCHES_BEFORE_BACKOFF = 3
+MAX_BACKOFF_MINUTES = 90
+consecutive_empty_searches = 0
+ticks_since_search = 0
 
 def initialize_monitor():
     """Initialize the job monitor with enhanced error handling."""
     global job_monitor
+    
+    # One monitor per process - it is shared by the scheduler and every route
+    if job_monitor is not None:
+        return True
+    
     logger.info("🔧 Initializing LinkedIn Job Monitor...")
     logger.info("=" * 50)
     
     # Check Railway environment
-    railway_env = os.getenv('RAILWAY_ENVIRONMENT', 'local')
-    logger.info(f"🚂 Railway Environment: {railway_env}")
+    logger.info("🚂 Railway Environment: %s", RAILWAY_ENV)
     
     # Validate required environment variables
     required_env_vars = ['DISCORD_WEBHOOK_URL', 'JOB_TITLE', 'CITIES']
@@ -56,22 +123,22 @@ def initialize_monitor():
             # Mask webhook URLs for security
             if 'WEBHOOK' in var:
                 masked_value = f"{value[:25]}...{value[-15:]}" if len(value) > 40 else value[:30] + "..."
-                logger.info(f"  ✅ {var}: {masked_value}")
+                logger.info("  ✅ %s: %s", var, masked_value)
             else:
-                logger.info(f"  ✅ {var}: {value}")
+                logger.info("  ✅ %s: %s", var, value)
         else:
             missing_vars.append(var)
-            logger.error(f"  ❌ {var}: NOT SET")
+            logger.error("  ❌ %s: NOT SET", var)
     
     if missing_vars:
-        logger.error(f"❌ Missing required environment variables: {missing_vars}")
+        logger.error("❌ Missing required environment variables: %s", missing_vars)
         return False
     
     # Create data directory if it doesn't exist
     data_dir = "data"
     if not os.path.exists(data_dir):
         os.makedirs(data_dir)
-        logger.info(f"📁 Created data directory: {data_dir}")
+        logger.info("📁 Created data directory: %s", data_dir)
     
     try:
         job_monitor = LinkedInJobMonitor()
@@ -83,10 +150,10 @@ def initialize_monitor():
             # Send startup notification
             startup_message = (
                 f"Railway Web Worker Started\n"
-                f"Environment: {railway_env}\n"
+                f"Environment: {RAILWAY_ENV}\n"
                 f"Time: {datetime.now().strftime('%H:%M:%S')}\n"
-                f"Cities: {', '.join(job_monitor.config.cities)}\n"
-                f"Job Title: {job_monitor.config.job_title}"
+                f"Cities: {CITIES_DISPLAY}\n"
+                f"Job Title: {JOB_TITLE}"
             )
             
             job_monitor.discord.notify_status(
@@ -104,16 +171,57 @@ def initialize_monitor():
             return False
             
     except Exception as e:
-        logger.error(f"❌ Error initializing monitor: {e}")
-        logger.error(f"Error details: {type(e).__name__}: {str(e)}")
+        logger.error("❌ Error initializing monitor: %s", e)
+        logger.error("Error details: %s: %s", type(e).__name__, str(e))
         return False
 
-def scheduled_job_search():
-    """Scheduled job search task."""
-    global last_search_time, last_search_result
+def backoff_ticks(interval_minutes):
+    """Number of scheduled ticks between searches given recent empty results."""
+    if consecutive_empty_searches < EMPTY_SEARCHES_BEFORE_BACKOFF:
+        return 1
+    
+    exponent = consecutive_empty_searches - EMPTY_SEARCHES_BEFORE_BACKOFF + 1
+    backoff_minutes = min(MAX_BACKOFF_MINUTES, interval_minutes * 2 ** exponent)
+    return max(1, backoff_minutes // interval_minutes)
+
+def scheduled_tick():
+    """Scheduler entry point - runs a search unless adaptive backoff skips this tick."""
+    global ticks_since_search
+    
+    interval_minutes = job_monitor.config.check_interval_minutes
+    ticks_since_search += 1
+    
+    required_ticks = backoff_ticks(interval_minutes)
+    if ticks_since_search < required_ticks:
+        logger.info("⏭️ Skipping scheduled search (%s empty searches in a row, "
+                    "searching every %s minutes)", consecutive_empty_searches, required_ticks * interval_minutes)
+        return
+    
+    # Widen the search window to cover any skipped ticks; a tick that loses
+    # the lock to another search keeps counting so no window is dropped
+    window_minutes = ticks_since_search * interval_minutes
+    if scheduled_job_search(window_minutes):
+        ticks_since_search = 0
+
+def scheduled_job_search(window_minutes=None):
+    """Scheduled job search task; returns whether the search ran."""
+    if not search_lock.acquire(blocking=False):
+        logger.info("⏳ A job search is already running - skipping this one")
+        return False
+    
+    try:
+        run_job_search(window_minutes)
+    finally:
+        search_lock.release()
+    return True
+
+def run_job_search(window_minutes=None):
+    """Run one job search and record the result; callers must hold search_lock."""
+    global _search_started
     
     logger.info("🔍 STARTING SCHEDULED JOB SEARCH")
-    last_search_time = datetime.now()
+    last_search_time = datetime.now(timezone.utc)
+    _search_started = last_search_time
     
     try:
         # Send status notification
@@ -122,45 +230,41 @@ def scheduled_job_search():
             f"Starting job search at {last_search_time.strftime('%H:%M:%S')}",
             'info'
         )
+    except Exception as e:
+        logger.error("Failed to send search started notification: %s", e)
         
-        # Find and notify jobs
-        total_jobs_sent = job_monitor.find_and_notify_jobs()
+    def on_result(result):
+        """Publish the result, update backoff state and report it to Discord."""
+        global _last, consecutive_empty_searches
         
-        last_search_result = {
-            'jobs_found': total_jobs_sent,
-            'success': True,
-            'timestamp': last_search_time.isoformat()
-        }
+        _last = (last_search_time, result)
+        total_jobs_sent = result['jobs_found']
+        duration = result['duration_s']
         
-        duration = (datetime.now() - last_search_time).total_seconds()
+        if not result['success']:
+            try:
+                job_monitor.discord.notify_status(
+                    "Job Search Error",
+                    f"Error during scheduled search: {result['error'][:200]}",
+                    'error'
+                )
+            except:
+                logger.error("Failed to send error notification")
+            return
+        
+        consecutive_empty_searches = 0 if total_jobs_sent > 0 else consecutive_empty_searches + 1
         
         if total_jobs_sent > 0:
-            logger.info(f"✅ SUCCESS: Found and sent {total_jobs_sent} jobs in {duration:.1f}s")
+            logger.info("✅ SUCCESS: Found and sent %s jobs in %.1fs", total_jobs_sent, duration)
             job_monitor.discord.notify_status(
                 "Job Search Complete",
                 f"Found and sent {total_jobs_sent} product management jobs in {duration:.1f}s",
                 'info'
             )
         else:
-            logger.info(f"📭 No new jobs found in {duration:.1f}s")
-        
-    except Exception as e:
-        logger.error(f"❌ ERROR during scheduled search: {e}")
-        last_search_result = {
-            'jobs_found': 0,
-            'success': False,
-            'error': str(e),
-            'timestamp': last_search_time.isoformat()
-        }
+            logger.info("📭 No new jobs found in %.1fs", duration)
         
-        try:
-            job_monitor.discord.notify_status(
-                "Job Search Error",
-                f"Error during scheduled search: {str(e)[:200]}",
-                'error'
-            )
-        except:
-            logger.error("Failed to send error notification")
+    run_search_cycle(job_monitor, window_minutes, on_result=on_result)
     
     logger.info("🏁 SCHEDULED JOB SEARCH COMPLETED")
 
@@ -174,7 +278,7 @@ def daily_summary_task():
         logger.info("✅ Daily summary sent successfully")
         
     except Exception as e:
-        logger.error(f"❌ Error sending daily summary: {e}")
+        logger.error("❌ Error sending daily summary: %s", e)
         
         # Send error notification
         try:
@@ -188,6 +292,53 @@ def daily_summary_task():
     
     logger.info("🏁 DAILY SUMMARY COMPLETED")
 
+def database_cleanup_task():
+    """Delete old jobs from the database at 2 AM ET."""
+    logger.info("🧹 STARTING DATABASE CLEANUP")
+    
+    try:
+        deleted = job_monitor.database.cleanup_old_jobs()
+        logger.info("✅ Database cleanup removed %s old jobs", deleted)
+    
+    except Exception as e:
+        logger.error("❌ Error during database cleanup: %s", e)
+    
+    logger.info("🏁 DATABASE CLEANUP COMPLETED")
+
+def on_scheduler_shutdown(event):
+    """Release monitor resources once the scheduler has stopped."""
+    logger.info("🛑 Scheduler stopped - cleaning up monitor")
+    if not job_monitor:
+        return
+    
+    # A search still running on a scheduler thread would hit a closed
+    # database and a shut down salary pool
+    if not search_lock.acquire(timeout=SHUTDOWN_LOCK_TIMEOUT):
+        logger.warning("⏳ A job search is still running - leaving monitor resources open")
+        return
+    
+    try:
+        job_monitor.cleanup()
+    finally:
+        search_lock.release()
+
+def stop_background_services():
+    """Stop the scheduler without waiting for an in-flight search.
+    
+    Railway sends SIGKILL shortly after SIGTERM, so blocking on a search that
+    can take minutes would only get the process killed mid-cleanup.
+    """
+    if scheduler and scheduler.running:
+        scheduler.shutdown(wait=False)
+
+# Search interval (minutes) -> (cron minute, cron hour) for intervals that
+# line up with the clock; searches run 9 AM to 11 PM ET
+CRON_TABLE = {
+    15: ('0,15,30,45', '9-23'),
+    30: ('0,30', '9-23'),
+    60: ('0', '9-23'),
+}
+
 def start_scheduler():
     """Start the job scheduler with 9am start and consistent schedule."""
     global scheduler
@@ -195,62 +346,75 @@ def start_scheduler():
     
     scheduler = BackgroundScheduler(
         timezone='US/Eastern',  # Set timezone for consistent scheduling
+        # Searches are serialized by search_lock, so the second thread is
+        # for cleanup and the daily summary - they never queue behind a slow
+        # search past misfire_grace_time. The per-city fan-out uses its own
+        # pool inside the monitor
+        executors={'default': ThreadPoolExecutor(max_workers=2)},
         job_defaults={
-            'coalesce': False,
+            'coalesce': True,
             'max_instances': 1,
             'misfire_grace_time': 300  # 5 minutes grace time
         }
     )
+    scheduler.add_listener(on_scheduler_shutdown, EVENT_SCHEDULER_SHUTDOWN)
     
     # Calculate interval from config (default 30 minutes)
-    interval_minutes = int(os.getenv('CHECK_INTERVAL_MINUTES', '30'))
+    interval_minutes = config.check_interval_minutes
     
     # Schedule job to run at consistent times starting at 9:00 AM ET
     # This ensures jobs run at 9:00, 9:30, 10:00, 10:30, etc.
-    logger.info(f"⏰ Scheduling jobs to run every {interval_minutes} minutes starting at 9:00 AM ET")
+    logger.info("⏰ Scheduling jobs to run every %s minutes starting at 9:00 AM ET", interval_minutes)
     logger.info("📋 Job Search Schedule: 9:00 AM, 9:30 AM, 10:00 AM, 10:30 AM, etc.")
     logger.info("📊 Daily Summary Schedule: 6:00 AM ET every day")
+    logger.info("🧹 Database Cleanup Schedule: 2:00 AM ET every day")
     
-    # Use cron trigger to run at specific minute intervals aligned to the hour
-    if interval_minutes == 30:
-        # Run at :00 and :30 minutes past each hour, starting from 9 AM
-        cron_minute = "0,30"
-        cron_hour = "9-23"  # 9 AM to 11 PM ET
-    elif interval_minutes == 15:
-        # Run every 15 minutes starting from 9 AM
-        cron_minute = "0,15,30,45"
-        cron_hour = "9-23"
-    elif interval_minutes == 60:
-        # Run every hour starting from 9 AM
-        cron_minute = "0"
-        cron_hour = "9-23"
-    else:
-        # Fallback to interval-based scheduling if custom interval
-        logger.info(f"Using interval-based scheduling for {interval_minutes} minute interval")
-        first_run = datetime.now() + timedelta(minutes=2)
-        scheduler.add_job(
-            func=scheduled_job_search,
-            trigger=IntervalTrigger(minutes=interval_minutes),
-            start_date=first_run,
-            id='railway_job_search',
-            name=f'Railway LinkedIn Job Search (every {interval_minutes}m)',
-            replace_existing=True
-        )
-        scheduler.start()
-        logger.info(f"✅ Job scheduler started with custom {interval_minutes}-minute interval")
-        return
-    
-    # Schedule with cron trigger for consistent times
+    # Prune old jobs once a day, off-hours, as its own job rather than
+    # piggybacking on the search ticks
     scheduler.add_job(
-        func=scheduled_job_search,
+        func=database_cleanup_task,
         trigger=CronTrigger(
+            minute=0,
+            hour=2,
+            timezone='US/Eastern'
+        ),
+        id='db_cleanup',
+        name='Database Cleanup (2:00 AM ET)',
+        replace_existing=True,
+        coalesce=True,
+        max_instances=1
+    )
+    
+    # Intervals that divide the hour run at fixed clock times from 9 AM (9:00,
+    # 9:30, 10:00, ...); any other interval falls back to a plain IntervalTrigger
+    cron_minute, cron_hour = CRON_TABLE.get(interval_minutes, (None, None))
+    if cron_minute:
+        trigger = CronTrigger(
             minute=cron_minute,
             hour=cron_hour,
             timezone='US/Eastern'
-        ),
-        id='railway_job_search_cron',
-        name=f'Railway LinkedIn Job Search (every {interval_minutes}m from 9 AM)',
-        replace_existing=True
+        )
+        schedule_description = f"every {interval_minutes}m from 9 AM"
+    else:
+        logger.info("Using interval-based scheduling for %s minute interval", interval_minutes)
+        trigger = IntervalTrigger(
+            minutes=interval_minutes,
+            start_date=datetime.now(timezone.utc) + timedelta(minutes=2)
+        )
+        schedule_description = f"every {interval_minutes}m"
+    
+    scheduler.add_job(
+        func=scheduled_tick,
+        trigger=trigger,
+        id='railway_job_search',
+        name=f'Railway LinkedIn Job Search ({schedule_description})',
+        replace_existing=True,
+        # A run that overruns the interval must not queue up backlog runs, and
+        # ticks missed while the worker was down (deploys, cold starts)
+        # collapse into a single catch-up search instead of a burst
+        coalesce=True,
+        max_instances=1,
+        misfire_grace_time=300
     )
     
     # Schedule daily summary at 6:00 AM ET
@@ -266,25 +430,53 @@ def start_scheduler():
         replace_existing=True
     )
     
-    # Also add immediate startup job (runs once in 2 minutes)
-    startup_time = datetime.now() + timedelta(minutes=2)
+    # Run one search shortly after startup - on the scheduler, so the web
+    # server is already answering health checks while it scrapes
+    startup_time = datetime.now(timezone.utc) + timedelta(seconds=10)
     scheduler.add_job(
-        func=lambda: logger.info("🚀 Startup job completed - cron schedule now active"),
+        func=scheduled_job_search,
         trigger='date',
         run_date=startup_time,
-        id='startup_job',
-        name='One-time startup job'
+        id='startup_search',
+        name='One-time startup search',
+        coalesce=True,
+        max_instances=1,
+        misfire_grace_time=60
     )
     
     scheduler.start()
-    logger.info(f"✅ Job scheduler started with cron schedule ({interval_minutes}m intervals from 9 AM)")
+    logger.info("✅ Job scheduler started (%s)", schedule_description)
     
     # Log scheduler info
-    logger.info(f"📊 Scheduler timezone: {scheduler.timezone}")
+    logger.info("📊 Scheduler timezone: %s", scheduler.timezone)
     jobs = scheduler.get_jobs()
-    logger.info(f"📊 Active jobs: {len(jobs)}")
+    logger.info("📊 Active jobs: %s", len(jobs))
     for job in jobs:
-        logger.info(f"  - {job.name} (next run: {job.next_run_time})")
+        logger.info("  - %s (next run: %s)", job.name, job.next_run_time)
+
+# Short-lived cache of probe responses: Railway polls /health often and each
+# build walks the scheduler's job store under its lock
+HEALTH_CACHE_TTL = 2.0
+STATUS_CACHE_TTL = 5.0
+_response_cache = {}
+
+def _cached(key, ttl, build):
+    """
+    Return a cached (body, status_code) pair, rebuilding it once it's older than ttl.
+    
+    Args:
+        key: Cache slot name (one per endpoint)
+        ttl: Maximum age in seconds
+        build: Zero-argument callable returning (body, status_code)
+    """
+    now = time.monotonic()
+    entry = _response_cache.get(key)
+    if entry and now - entry[0] < ttl:
+        return entry[1], entry[2]
+    
+    body, code = build()
+    _response_cache[key] = (now, body, code)
+    return body, code
 
 @app.route('/')
 def home():
@@ -293,15 +485,22 @@ def home():
         'status': 'running',
         'service': 'LinkedIn Job Monitor',
         'environment': 'Railway',
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': datetime.now(timezone.utc),
         'scheduler_running': scheduler.running if scheduler else False,
-        'last_search': last_search_result
+        'last_search': _last[1]
     })
 
-@app.route('/health')
-def health():
-    """Enhanced health check endpoint for Railway."""
-    now = datetime.now()
+def _build_health():
+    """Build the /health body and HTTP status code."""
+    last_search_time, last_search_result = _last
+    now = datetime.now(timezone.utc)
+    
+    # Snapshot the job list once; APScheduler doesn't promise index 0 is the
+    # soonest, and paused jobs have no next run time
+    scheduler_jobs = scheduler.get_jobs() if scheduler else []
+    next_run_time = min((job.next_run_time for job in scheduler_jobs if job.next_run_time), default=None)
+    
+    minutes_since = int((now - last_search_time).total_seconds() / 60) if last_search_time else None
     
     # Determine overall health status
     is_healthy = True
@@ -317,7 +516,6 @@ def health():
     
     # Check if we've had a recent search (within last 2 hours)
     if last_search_time:
-        minutes_since = int((now - last_search_time).total_seconds() / 60)
         if minutes_since > 120:  # More than 2 hours
             is_healthy = False
             issues.append(f"No search in {minutes_since} minutes")
@@ -326,22 +524,22 @@ def health():
     
     health_status = {
         'status': 'healthy' if is_healthy else 'unhealthy',
-        'timestamp': now.isoformat(),
-        'uptime_minutes': int((now - datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)).total_seconds() / 60),
-        'railway_environment': os.getenv('RAILWAY_ENVIRONMENT', 'local'),
+        'timestamp': now,
+        'uptime_minutes': int((time.monotonic() - _PROCESS_START) / 60),
+        'railway_environment': RAILWAY_ENV,
         'scheduler': {
             'running': scheduler.running if scheduler else False,
-            'job_count': len(scheduler.get_jobs()) if scheduler else 0,
-            'next_job_time': scheduler.get_jobs()[0].next_run_time.isoformat() if scheduler and scheduler.get_jobs() else None
+            'job_count': len(scheduler_jobs),
+            'next_job_time': next_run_time
         },
         'monitor': {
             'initialized': job_monitor is not None,
-            'cities': job_monitor.config.cities if job_monitor else None,
-            'job_title': job_monitor.config.job_title if job_monitor else None
+            'cities': CITIES if job_monitor else None,
+            'job_title': JOB_TITLE if job_monitor else None
         },
         'last_search': {
-            'time': last_search_time.isoformat() if last_search_time else None,
-            'minutes_ago': int((now - last_search_time).total_seconds() / 60) if last_search_time else None,
+            'time': last_search_time,
+            'minutes_ago': minutes_since,
             'result': last_search_result
         },
         'issues': issues
@@ -349,79 +547,141 @@ def health():
     
     # Return appropriate HTTP status
     status_code = 200 if is_healthy else 503
-    return jsonify(health_status), status_code
+    return health_status, status_code
 
-@app.route('/status')
-def status():
-    """Detailed status endpoint."""
-    return jsonify({
+@app.route('/health')
+def health():
+    """Enhanced health check endpoint for Railway."""
+    body, status_code = _cached('health', HEALTH_CACHE_TTL, _build_health)
+    return jsonify(body), status_code
+
+def _build_status():
+    """Build the /status body and HTTP status code."""
+    last_search_time, last_search_result = _last
+    return {
         'service': 'LinkedIn Job Monitor',
-        'environment': os.getenv('RAILWAY_ENVIRONMENT', 'unknown'),
+        'environment': RAILWAY_ENV,
         'scheduler_running': scheduler.running if scheduler else False,
         'job_monitor_initialized': job_monitor is not None,
-        'cities_monitored': config.cities,
-        'job_title': config.job_title,
+        'cities_monitored': CITIES,
+        'job_title': JOB_TITLE,
         'last_search_result': last_search_result,
-        'last_search_time': last_search_time.isoformat() if last_search_time else None,
-        'uptime': datetime.now().isoformat()
-    })
+        'last_search_time': last_search_time,
+        'search_running_since': _search_started if search_lock.locked() else None,
+        'uptime': datetime.now(timezone.utc)
+    }, 200
+
+@app.route('/status')
+def status():
+    """Detailed status endpoint."""
+    body, status_code = _cached('status', STATUS_CACHE_TTL, _build_status)
+    return jsonify(body), status_code
 
 @app.route('/trigger')  
 def trigger_search():
     """Manually trigger a job search for testing with rate limiting."""
-    global last_search_time
+    last_search_time = _search_started
+    
+    now = datetime.now(timezone.utc)
     
     # Simple rate limiting - only allow manual triggers every 5 minutes
-    if last_search_time and (datetime.now() - last_search_time).total_seconds() < 300:
-        minutes_left = 5 - int((datetime.now() - last_search_time).total_seconds() / 60)
+    if last_search_time and (now - last_search_time).total_seconds() < 300:
+        minutes_left = 5 - int((now - last_search_time).total_seconds() / 60)
         return jsonify({
             'status': 'rate_limited',
             'message': f'Please wait {minutes_left} minutes before triggering again',
-            'last_search_time': last_search_time.isoformat()
+            'last_search_time': last_search_time
         }), 429
     
+    if not scheduler or not scheduler.running:
+        return jsonify({
+            'status': 'error',
+            'message': 'Scheduler not running',
+            'timestamp': now
+        }), 503
+    
+    # Cheap early reject - the search itself would just skip under the lock
+    if search_lock.locked():
+        return jsonify({
+            'status': 'busy',
+            'message': 'A job search is already running - check /status for the result',
+            'timestamp': now
+        }), 409
+    
     try:
         logger.info("🔥 Manual job search triggered via web endpoint")
-        scheduled_job_search()
+        
+        # Run the search on the scheduler's worker threads so this request
+        # (and Railway's health checks) aren't blocked for the whole search
+        scheduler.add_job(
+            func=scheduled_job_search,
+            trigger='date',
+            run_date=now,
+            id='manual_trigger',
+            name='Manual job search',
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True
+        )
         return jsonify({
-            'status': 'success',
-            'message': 'Job search triggered successfully',
-            'timestamp': datetime.now().isoformat(),
-            'result': last_search_result
-        })
+            'status': 'queued',
+            'message': 'Job search queued - check /status for the result',
+            'timestamp': now
+        }), 202
     except Exception as e:
-        logger.error(f"Error in manual trigger: {e}")
+        logger.error("Error in manual trigger: %s", e)
         return jsonify({
             'status': 'error',
             'message': f'Error triggering job search: {str(e)}',
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now
         }), 500
 
-if __name__ == '__main__':
+def start_background_services():
+    """
+    Initialize the monitor and start the job scheduler.
+    
+    Called once per process: from gunicorn's post_worker_init hook in
+    production, or from __main__ when running the Flask dev server locally.
+    
+    Returns:
+        True if both the monitor and the scheduler started
+    """
     logger.info("🚀 RAILWAY WEB WORKER STARTING")
     logger.info("=" * 60)
     
     # Check Railway environment
-    railway_env = os.getenv('RAILWAY_ENVIRONMENT', 'local')
-    port = int(os.getenv('PORT', 8080))
-    
-    logger.info(f"Environment: {railway_env}")
-    logger.info(f"Port: {port}")
+    logger.info("Environment: %s", RAILWAY_ENV)
     
     # Initialize components
     if not initialize_monitor():
         logger.error("❌ Failed to initialize monitor - exiting")
-        sys.exit(1)
+        return False
     
     # Start scheduler
     try:
         start_scheduler()
     except Exception as e:
-        logger.error(f"❌ Failed to start scheduler: {e}")
+        logger.error("❌ Failed to start scheduler: %s", e)
+        return False
+    
+    atexit.register(stop_background_services)
+    return True
+
+if __name__ == '__main__':
+    # On Railway, `python railway_web_worker.py` hands the process over to
+    # gunicorn (see gunicorn_conf.py); the Flask dev server is for local runs only
+    if os.getenv('RAILWAY_ENVIRONMENT'):
+        logger.info("🦄 Railway detected - starting gunicorn")
+        os.execvp("gunicorn", ["gunicorn", "-c", "gunicorn_conf.py", "railway_web_worker:app"])
+    
+    port = int(os.getenv('PORT', 8080))
+    logger.info("Port: %s", port)
+    
+    if not start_background_services():
         sys.exit(1)
     
     # Start web server
-    logger.info(f"🌐 Starting web server on port {port}")
+    logger.info("🌐 Starting web server on port %s", port)
     logger.info("📍 Available endpoints:")
     logger.info("  / - Home status")
     logger.info("  /health - Health check")
@@ -431,7 +691,6 @@ if __name__ == '__main__':
     try:
         app.run(host='0.0.0.0', port=port, debug=False)
     except Exception as e:
-        logger.error(f"❌ Web server error: {e}")
-        if scheduler:
-            scheduler.shutdown()
+        logger.error("❌ Web server error: %s", e)
+        stop_background_services()
         sys.exit(1)
\ No newline at end of file
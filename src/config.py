@@ -4,27 +4,39 @@ Configuration module for LinkedIn Job Monitor
 Handles environment variables, settings, and LinkedIn search URLs.
 """
 
+import logging
 import os
 from dataclasses import dataclass
-from typing import List, Dict
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Tuple
+from urllib.parse import urlencode, quote_plus
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Load environment variables from .env file (local development only -
+# Railway injects them directly, so there's no file to read there)
+if os.getenv('RAILWAY_ENVIRONMENT') is None:
+    load_dotenv()
+
+# Frozen so nothing can patch settings at runtime; eq=False keeps the default
+# identity hash, so a Config can be used as a cache key
+@dataclass(frozen=True, slots=True, eq=False)
 class Config:
     """Configuration class containing all application settings."""
     
     # Discord settings
     discord_webhook_url: str  # Main webhook (for backwards compatibility)
     
-    # City-specific Discord webhooks
-    discord_webhook_urls: Dict[str, str]
+    # City-specific Discord webhooks (read-only view)
+    discord_webhook_urls: Mapping[str, str]
+    
+    # HEAD-check Clearbit logos before using them (off keeps embeds zero-network)
+    verify_company_logos: bool
     
     # Monitoring settings
     check_interval_minutes: int
-    cities: List[str]
+    cities: Tuple[str, ...]
     job_title: str
     
     # Database
@@ -37,22 +49,38 @@ class Config:
     @classmethod
     def from_env(cls) -> 'Config':
         """Create configuration from environment variables."""
+        discord_webhook_url = os.getenv('DISCORD_WEBHOOK_URL', '')
+        discord_webhook_urls = {
+            'Remote': os.getenv('DISCORD_WEBHOOK_URL_Remote', ''),
+            'NYC': os.getenv('DISCORD_WEBHOOK_URL_NYC', ''),
+            'SF': os.getenv('DISCORD_WEBHOOK_URL_SF', ''),
+            'LA': os.getenv('DISCORD_WEBHOOK_URL_LA', ''),
+            'SD': os.getenv('DISCORD_WEBHOOK_URL_SD', '')
+        }
+        
+        # Only search cities whose jobs have somewhere to go: their own
+        # webhook, or the main webhook as a catch-all
+        requested_cities = os.getenv('CITIES', 'NYC,LA,SF,SD').split(',')
+        if discord_webhook_url:
+            cities = tuple(requested_cities)
+        else:
+            cities = tuple(city for city in requested_cities if discord_webhook_urls.get(city))
+        
+        skipped_cities = [city for city in requested_cities if city not in cities]
+        if skipped_cities:
+            logger.warning(f"⚠️ Not searching {', '.join(skipped_cities)} - no Discord webhook configured")
+        
         return cls(
             # Discord
-            discord_webhook_url=os.getenv('DISCORD_WEBHOOK_URL', ''),
+            discord_webhook_url=discord_webhook_url,
             
             # City-specific Discord webhooks
-            discord_webhook_urls={
-                'Remote': os.getenv('DISCORD_WEBHOOK_URL_Remote', ''),
-                'NYC': os.getenv('DISCORD_WEBHOOK_URL_NYC', ''),
-                'SF': os.getenv('DISCORD_WEBHOOK_URL_SF', ''),
-                'LA': os.getenv('DISCORD_WEBHOOK_URL_LA', ''),
-                'SD': os.getenv('DISCORD_WEBHOOK_URL_SD', '')
-            },
+            discord_webhook_urls=MappingProxyType(discord_webhook_urls),
+            verify_company_logos=os.getenv('VERIFY_COMPANY_LOGOS', 'false').lower() == 'true',
             
             # Monitoring
             check_interval_minutes=int(os.getenv('CHECK_INTERVAL_MINUTES', '30')),
-            cities=os.getenv('CITIES', 'NYC,LA,SF,SD').split(','),
+            cities=cities,
             job_title=os.getenv('JOB_TITLE', 'Associate Product Manager'),
             
             # Database
@@ -67,8 +95,6 @@ class Config:
         """Validate that required configuration is present."""
         # Check if at least one Discord webhook is configured
         if not self.discord_webhook_url and not any(self.discord_webhook_urls.values()):
-            import logging
-            logger = logging.getLogger(__name__)
             logger.error("No Discord webhook URLs configured")
             return False
         
@@ -107,15 +133,15 @@ class LinkedInURLBuilder:
         
         # LinkedIn URL parameters (matching actual LinkedIn URLs)
         params = {
-            'keywords': job_title.replace(' ', '%20'),
+            'keywords': job_title,
             'geoId': location_id,
             'f_TPR': cls._get_time_filter(posted_time),
             'origin': 'JOB_SEARCH_PAGE_JOB_FILTER',
             'refresh': 'true'
         }
         
-        # Build query string
-        query_string = '&'.join([f'{key}={value}' for key, value in params.items()])
+        # urlencode escapes spaces, '&', '+' and non-ASCII characters in the title
+        query_string = urlencode(params, quote_via=quote_plus)
         
         return f"{cls.BASE_URL}?{query_string}"
     
@@ -139,8 +165,6 @@ class LinkedInURLBuilder:
             try:
                 urls[city] = cls.build_search_url(job_title, city)
             except ValueError as e:
-                import logging
-                logger = logging.getLogger(__name__)
                 logger.warning(f"Warning: {e}")
         return urls
 
@@ -149,9 +173,6 @@ def get_config() -> Config:
     config = Config.from_env()
     
     # Log configuration details for Railway debugging
-    import logging
-    logger = logging.getLogger(__name__)
-    
     railway_env = os.getenv('RAILWAY_ENVIRONMENT')
     if railway_env:
         logger.info(f"🚂 Running in Railway environment: {railway_env}")
@@ -180,5 +201,14 @@ def get_config() -> Config:
     logger.info("✅ Configuration validated successfully")
     return config
 
-# Global configuration instance
-config = get_config()
\ No newline at end of file
+# Global configuration instance, built on first access (PEP 562) so importing
+# this module doesn't parse and validate the environment as a side effect
+_config = None
+
+def __getattr__(name: str):
+    global _config
+    if name == 'config':
+        if _config is None:
+            _config = get_config()
+        return _config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
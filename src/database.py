@@ -4,10 +4,13 @@ Database module for LinkedIn Job Monitor
 Handles job tracking, deduplication, and persistence using SQLite.
 """
 
+import os
 import sqlite3
 import hashlib
 import json
 import logging
+import threading
+import time
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, asdict
@@ -16,17 +19,150 @@ from pathlib import Path
 # Setup logging
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Rows deleted per transaction by cleanup_old_jobs
+CLEANUP_BATCH_SIZE = 1000
+
+# A job seen again within this long of its stored last_seen isn't written at
+# all; search windows overlap heavily, so most repeat sightings skip SQLite.
+# This makes last_seen coarse: it can lag the latest sighting by up to this long
+LAST_SEEN_REFRESH_SECONDS = 6 * 3600
+
+# Per-connection cache settings, applied to the read-only handle as well
+SQLITE_READ_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Applied to the writer connection before the schema is created
+SQLITE_PRAGMAS = (
+    "PRAGMA page_size=4096",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+) + SQLITE_READ_PRAGMAS
+
+# Bumped whenever the on-disk layout changes; stored in PRAGMA user_version
+SCHEMA_VERSION = 3
+
+# Timestamps are stored as INTEGER unix seconds: range filters compare
+# numbers instead of strings and reads skip ISO parsing
+sqlite3.register_adapter(datetime, lambda d: int(d.timestamp()))
+
+# job_hash is the primary key of a WITHOUT ROWID table, so every lookup by
+# hash is a single probe of the clustered B-tree
+JOBS_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_hash TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    company TEXT NOT NULL,
+    location TEXT NOT NULL,
+    linkedin_url TEXT,
+    first_seen INTEGER NOT NULL,
+    last_seen INTEGER NOT NULL,  -- coarse: refreshed at most every LAST_SEEN_REFRESH_SECONDS
+    notified BOOLEAN DEFAULT FALSE,
+    
+    -- Job data fields
+    pay_range_min INTEGER,
+    pay_range_max INTEGER,
+    pay_range_text TEXT,
+    pay_type TEXT DEFAULT 'yearly',
+    location_type TEXT,
+    city TEXT,
+    posted_time TEXT,
+    posted_hours_ago INTEGER,
+    linkedin_job_id TEXT,
+    company_career_url TEXT,
+    
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+) WITHOUT ROWID;
+"""
+
+# Columns carried over when the jobs table is rebuilt by a migration
+JOB_COLUMNS = (
+    "job_hash, title, company, location, linkedin_url, first_seen, last_seen, notified, "
+    "pay_range_min, pay_range_max, pay_range_text, pay_type, location_type, city, "
+    "posted_time, posted_hours_ago, linkedin_job_id, company_career_url, created_at"
+)
+
+# Selected in Job field order so rows come back as plain tuples that unpack
+# positionally, without sqlite3.Row's per-column name lookup
+JOB_SELECT_COLUMNS = (
+    "title, company, location, linkedin_url, job_hash, first_seen, last_seen, notified, "
+    "pay_range_min, pay_range_max, pay_range_text, pay_type, location_type, city, "
+    "posted_time, posted_hours_ago, linkedin_job_id, company_career_url"
+)
+
+# Hot-path statements, kept as constants so every call hands sqlite3 the
+# same string and hits its prepared-statement cache
+STATEMENT_CACHE_SIZE = 256
+
+INSERT_JOB_SQL = """
+INSERT INTO jobs (
+    title, company, location, linkedin_url, job_hash,
+    first_seen, last_seen, notified,
+    pay_range_min, pay_range_max, pay_range_text, pay_type,
+    location_type, city, posted_time, posted_hours_ago,
+    linkedin_job_id, company_career_url
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(job_hash) DO NOTHING
+RETURNING job_hash
+"""
+
+UPDATE_LAST_SEEN_SQL = "UPDATE jobs SET last_seen = ? WHERE job_hash = ?"
+
+UPDATE_SALARY_SQL = "UPDATE jobs SET pay_range_text = ?, pay_range_min = ?, pay_range_max = ? WHERE job_hash = ?"
+
+GET_JOB_BY_HASH_SQL = f"SELECT {JOB_SELECT_COLUMNS} FROM jobs WHERE job_hash = ?"
+
+RECENT_JOBS_SQL = f"""
+SELECT {JOB_SELECT_COLUMNS} FROM jobs
+WHERE first_seen > ?
+ORDER BY first_seen DESC
+LIMIT ?
+"""
+
+# Written with notified = 0 so the planner matches the partial index
+UNNOTIFIED_JOBS_SQL = f"SELECT {JOB_SELECT_COLUMNS} FROM jobs WHERE notified = 0 ORDER BY first_seen DESC"
+
+# Hashes are bound as one JSON array so the statement text (and its cached
+# plan) is the same no matter how many jobs a batch holds
+MARK_NOTIFIED_SQL = "UPDATE jobs SET notified = TRUE WHERE job_hash IN (SELECT value FROM json_each(?))"
+
+LOG_SEARCH_SQL = """
+INSERT INTO search_history (
+    city, search_url, screenshot_count, jobs_found, success, error_message, timestamp
+) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Parameterised once; copying it is cheaper than constructing a new hasher
+_HASH_SEED = hashlib.blake2b(digest_size=8)
+
+def job_hash(title: str, company: str, location: str) -> str:
+    """
+    Hash the normalized title, company and location of a job.
+    
+    A 64-bit BLAKE2b digest is plenty to keep a few thousand jobs apart and
+    keeps the primary key at 16 hex characters.
+    """
+    # Strip before lowering so the lowercase copy is only as long as needed
+    h = _HASH_SEED.copy()
+    h.update(title.strip().lower().encode())
+    h.update(b'|')
+    h.update(company.strip().lower().encode())
+    h.update(b'|')
+    h.update(location.strip().lower().encode())
+    return h.hexdigest()
+
+@dataclass(slots=True)
 class Job:
     """Data class representing a job posting."""
-    id: Optional[int] = None
     title: str = ""
     company: str = ""
     location: str = ""
     linkedin_url: str = ""
     job_hash: str = ""
     first_seen: datetime = None
-    last_seen: datetime = None
+    last_seen: datetime = None  # coarse - may lag by up to LAST_SEEN_REFRESH_SECONDS
     notified: bool = False
     
     # Job data fields
@@ -43,19 +179,44 @@ class Job:
     
     def __post_init__(self):
         """Initialize computed fields after object creation."""
-        if self.first_seen is None:
-            self.first_seen = datetime.now(timezone.utc)
-        if self.last_seen is None:
-            self.last_seen = datetime.now(timezone.utc)
+        if self.first_seen is None or self.last_seen is None:
+            now = datetime.now(timezone.utc)
+            if self.first_seen is None:
+                self.first_seen = now
+            if self.last_seen is None:
+                self.last_seen = now
         if not self.job_hash and self.title and self.company:
             self.job_hash = self._generate_hash()
     
     def _generate_hash(self) -> str:
         """Generate a unique hash for this job based on title and company."""
-        # Create a unique identifier from title, company, and location
-        content = f"{self.title.lower().strip()}|{self.company.lower().strip()}|{self.location.lower().strip()}"
-        return hashlib.md5(content.encode('utf-8')).hexdigest()
+        return job_hash(self.title, self.company, self.location)
+    
+
+_fromtimestamp = datetime.fromtimestamp
+
+def job_from_row(row) -> Job:
+    """
+    Convert a row selected with JOB_SELECT_COLUMNS to a Job object.
+    
+    A plain function with the timestamp constructor bound at module level,
+    so mapping it over a result set skips a method and attribute lookup per
+    row.
+    """
+    (title, company, location, linkedin_url, job_hash, first_seen, last_seen, notified,
+     pay_range_min, pay_range_max, pay_range_text, pay_type, location_type, city,
+     posted_time, posted_hours_ago, linkedin_job_id, company_career_url) = row
     
+    return Job(
+        title, company, location, linkedin_url, job_hash,
+        _fromtimestamp(first_seen, timezone.utc),
+        _fromtimestamp(last_seen, timezone.utc),
+        bool(notified),
+        pay_range_min, pay_range_max, pay_range_text or '', pay_type or 'yearly',
+        location_type or '', city or '', posted_time or '', posted_hours_ago,
+        linkedin_job_id or '', company_career_url or ''
+    )
+
 
 class JobDatabase:
     """Database manager for job tracking."""
@@ -67,64 +228,105 @@ class JobDatabase:
         # Create data directory if it doesn't exist
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row  # Enable column access by name
+        # isolation_level=None: no implicit BEGIN; writes that span several
+        # statements open their own BEGIN IMMEDIATE ... COMMIT
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None,
+                                    cached_statements=STATEMENT_CACHE_SIZE)
+        
+        # Serializes writers on the shared connection so one thread's
+        # statements never land inside another thread's open transaction
+        self._write_lock = threading.Lock()
+        self._configure_connection()
+        self._migrate_schema()
         self._create_tables()
+        
+        # Every stored hash with its last_seen (unix seconds), so jobs seen on
+        # an earlier search are recognised without probing SQLite; kept in
+        # step by add_jobs and cleanup_old_jobs
+        self._known_hashes = dict(self.conn.execute("SELECT job_hash, last_seen FROM jobs"))
+        
+        # Read-only queries (stats, listings, lookups) get their own connection;
+        # under WAL they then never wait on a search that is writing. An
+        # in-memory database only exists on the writer connection, so reads
+        # share it there
+        if db_path == ':memory:':
+            self._ro = self.conn
+        else:
+            self._ro = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True,
+                                       check_same_thread=False, isolation_level=None,
+                                       cached_statements=STATEMENT_CACHE_SIZE)
+            for pragma in SQLITE_READ_PRAGMAS:
+                self._ro.execute(pragma)
     
-    def _row_to_job(self, row) -> Job:
-        """Convert database row to Job object."""
-        return Job(
-            id=row['id'],
-            title=row['title'],
-            company=row['company'],
-            location=row['location'],
-            linkedin_url=row['linkedin_url'],
-            job_hash=row['job_hash'],
-            first_seen=datetime.fromisoformat(row['first_seen']),
-            last_seen=datetime.fromisoformat(row['last_seen']),
-            notified=bool(row['notified']),
-            pay_range_min=row['pay_range_min'],
-            pay_range_max=row['pay_range_max'],
-            pay_range_text=row['pay_range_text'] or '',
-            pay_type=row['pay_type'] or 'yearly',
-            location_type=row['location_type'] or '',
-            city=row['city'] or '',
-            posted_time=row['posted_time'] or '',
-            posted_hours_ago=row['posted_hours_ago'],
-            linkedin_job_id=row['linkedin_job_id'] or '',
-            company_career_url=row['company_career_url'] or ''
-        )
+    def _configure_connection(self):
+        """
+        Tune the connection for many small write transactions.
+        
+        WAL makes each commit a single sequential append instead of two
+        fsyncs, and lets readers proceed while a search is writing.
+        page_size only takes effect before the first table is created.
+        """
+        for pragma in SQLITE_PRAGMAS:
+            self.conn.execute(pragma)
+    
+    def _migrate_schema(self):
+        """Rebuild tables created by an older release to the current layout."""
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        has_jobs = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs'"
+        ).fetchone()
+        
+        if version >= SCHEMA_VERSION or not has_jobs:
+            return
+        
+        cursor = self.conn.cursor()
+        
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            
+            if version < 1:
+                # v0 keyed jobs on an AUTOINCREMENT id with a separate unique
+                # index on job_hash; copy into the WITHOUT ROWID layout
+                cursor.execute("ALTER TABLE jobs RENAME TO jobs_v0")
+                cursor.execute(JOBS_TABLE_SQL)
+                cursor.execute(f"INSERT INTO jobs ({JOB_COLUMNS}) SELECT {JOB_COLUMNS} FROM jobs_v0")
+                cursor.execute("DROP TABLE jobs_v0")
+            
+            if version < 2:
+                # v1 stored timestamps as ISO text; convert them to unix seconds
+                cursor.execute("""
+                    UPDATE jobs SET
+                        first_seen = CAST(strftime('%s', first_seen) AS INTEGER),
+                        last_seen = CAST(strftime('%s', last_seen) AS INTEGER)
+                    WHERE typeof(first_seen) = 'text' OR typeof(last_seen) = 'text'
+                """)
+                cursor.execute("""
+                    UPDATE search_history SET timestamp = CAST(strftime('%s', timestamp) AS INTEGER)
+                    WHERE typeof(timestamp) = 'text'
+                """)
+            
+            if version < 3:
+                # v2 keyed jobs on a 128-bit MD5 hex digest; rehash in Python
+                cursor.execute("SELECT job_hash, title, company, location FROM jobs")
+                rehashed = [(job_hash(title, company, location), old_hash)
+                            for old_hash, title, company, location in cursor.fetchall()]
+                cursor.executemany("UPDATE OR IGNORE jobs SET job_hash = ? WHERE job_hash = ?", rehashed)
+            
+            cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            cursor.execute("COMMIT")
+            logger.info(f"Migrated database schema from v{version} to v{SCHEMA_VERSION}")
+        
+        except sqlite3.Error as e:
+            # Fail startup rather than run against (and later stamp as
+            # current) a table still in the old layout
+            logger.error(f"Error migrating database schema: {e}")
+            self.conn.rollback()
+            raise
+        finally:
+            cursor.close()
     
     def _create_tables(self):
         """Create database tables if they don't exist."""
-        create_jobs_table = """
-        CREATE TABLE IF NOT EXISTS jobs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            company TEXT NOT NULL,
-            location TEXT NOT NULL,
-            linkedin_url TEXT,
-            job_hash TEXT UNIQUE NOT NULL,
-            first_seen TIMESTAMP NOT NULL,
-            last_seen TIMESTAMP NOT NULL,
-            notified BOOLEAN DEFAULT FALSE,
-            
-            -- Job data fields
-            pay_range_min INTEGER,
-            pay_range_max INTEGER,
-            pay_range_text TEXT,
-            pay_type TEXT DEFAULT 'yearly',
-            location_type TEXT,
-            city TEXT,
-            posted_time TEXT,
-            posted_hours_ago INTEGER,
-            linkedin_job_id TEXT,
-            company_career_url TEXT,
-            
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-        """
-        
         create_search_history_table = """
         CREATE TABLE IF NOT EXISTS search_history (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -132,30 +334,47 @@ class JobDatabase:
             search_url TEXT NOT NULL,
             screenshot_count INTEGER DEFAULT 0,
             jobs_found INTEGER DEFAULT 0,
-            timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            timestamp INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
             success BOOLEAN DEFAULT TRUE,
             error_message TEXT
         );
         """
         
+        # The job indexes let the list queries scan in first_seen order without
+        # a separate sort step, and the partial index only holds jobs still
+        # waiting to be notified; indexes they replace are dropped from
+        # existing databases
         create_indexes = [
-            "CREATE INDEX IF NOT EXISTS idx_job_hash ON jobs(job_hash);",
-            "CREATE INDEX IF NOT EXISTS idx_first_seen ON jobs(first_seen);",
-            "CREATE INDEX IF NOT EXISTS idx_notified ON jobs(notified);",
+            "DROP INDEX IF EXISTS idx_first_seen;",
+            "DROP INDEX IF EXISTS idx_notified;",
+            "CREATE INDEX IF NOT EXISTS idx_first_seen_desc ON jobs(first_seen DESC);",
+            "DROP INDEX IF EXISTS idx_notified_first_seen;",
+            "CREATE INDEX IF NOT EXISTS idx_unnotified_recent ON jobs(first_seen DESC) WHERE notified = 0;",
             "CREATE INDEX IF NOT EXISTS idx_city ON search_history(city);",
-            "CREATE INDEX IF NOT EXISTS idx_timestamp ON search_history(timestamp);"
+            "DROP INDEX IF EXISTS idx_timestamp;",
+            "CREATE INDEX IF NOT EXISTS idx_timestamp_success ON search_history(timestamp, success);"
         ]
         
         cursor = self.conn.cursor()
         
         try:
-            cursor.execute(create_jobs_table)
+            cursor.execute("BEGIN IMMEDIATE")
+            
+            # Only a jobs table created here is known to be in the current
+            # layout; an existing one keeps the version _migrate_schema left
+            has_jobs = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs'"
+            ).fetchone()
+            
+            cursor.execute(JOBS_TABLE_SQL)
             cursor.execute(create_search_history_table)
             
             for index_sql in create_indexes:
                 cursor.execute(index_sql)
             
-            self.conn.commit()
+            if not has_jobs:
+                cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            cursor.execute("COMMIT")
             logger.info("Database initialized successfully")
             
         except sqlite3.Error as e:
@@ -174,190 +393,223 @@ class JobDatabase:
         Returns:
             True if job was added (new), False if job already exists
         """
-        cursor = self.conn.cursor()
+        return bool(self.add_jobs([job]))
+    
+    def add_jobs(self, jobs: List[Job]) -> List[Job]:
+        """
+        Add a batch of jobs in a single transaction.
         
-        try:
-            # Check if job already exists
-            existing_job = self.get_job_by_hash(job.job_hash)
-            
-            if existing_job:
-                # Update last_seen timestamp
-                cursor.execute(
-                    "UPDATE jobs SET last_seen = ? WHERE job_hash = ?",
-                    (datetime.now(timezone.utc), job.job_hash)
-                )
-                self.conn.commit()
-                return False  # Job already existed
-            
-            # Insert new job
-            cursor.execute("""
-                INSERT INTO jobs (
-                    title, company, location, linkedin_url, job_hash,
-                    first_seen, last_seen, notified,
-                    pay_range_min, pay_range_max, pay_range_text, pay_type,
-                    location_type, city, posted_time, posted_hours_ago,
-                    linkedin_job_id, company_career_url
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                job.title, job.company, job.location, job.linkedin_url,
-                job.job_hash, job.first_seen, job.last_seen, job.notified,
-                job.pay_range_min, job.pay_range_max, job.pay_range_text, job.pay_type,
-                job.location_type, job.city, job.posted_time, job.posted_hours_ago,
-                job.linkedin_job_id, job.company_career_url
-            ))
-            
-            self.conn.commit()
-            return True  # New job added
+        Jobs whose hash is already known in memory only get last_seen
+        refreshed, and only once it is LAST_SEEN_REFRESH_SECONDS old. The
+        rest are written with INSERT ... ON CONFLICT DO NOTHING, which
+        reports through RETURNING whether the row was new. The whole batch
+        shares one lock and one commit, and a batch of recently seen jobs
+        doesn't open a transaction at all.
+        
+        Args:
+            jobs: Job instances to add
+        
+        Returns:
+            The jobs that were new to the database, in input order
+        """
+        if not jobs:
+            return []
+        
+        with self._write_lock:
+            now = datetime.now(timezone.utc)
+            now_ts = int(now.timestamp())
+            refresh_before = now_ts - LAST_SEEN_REFRESH_SECONDS
+            
+            candidates = []
+            existing = []
+            seen = set()
+            for job in jobs:
+                if job.job_hash in seen:
+                    continue
+                seen.add(job.job_hash)
+                
+                last_seen = self._known_hashes.get(job.job_hash)
+                if last_seen is None:
+                    candidates.append(job)
+                elif last_seen < refresh_before:
+                    existing.append((now, job.job_hash))
             
-        except sqlite3.Error as e:
-            logger.error(f"Error adding job: {e}")
-            self.conn.rollback()
-            return False
-        finally:
-            cursor.close()
+            if not candidates and not existing:
+                return []
+            
+            cursor = self.conn.cursor()
+            
+            try:
+                cursor.execute("BEGIN IMMEDIATE")
+                
+                new_jobs = []
+                for job in candidates:
+                    cursor.execute(INSERT_JOB_SQL, (
+                        job.title, job.company, job.location, job.linkedin_url,
+                        job.job_hash, now, now, job.notified,
+                        job.pay_range_min, job.pay_range_max, job.pay_range_text, job.pay_type,
+                        job.location_type, job.city, job.posted_time, job.posted_hours_ago,
+                        job.linkedin_job_id, job.company_career_url
+                    ))
+                    
+                    if cursor.fetchone():
+                        job.first_seen = job.last_seen = now
+                        new_jobs.append(job)
+                    else:
+                        existing.append((now, job.job_hash))
+                
+                if existing:
+                    cursor.executemany(UPDATE_LAST_SEEN_SQL, existing)
+                
+                cursor.execute("COMMIT")
+                self._known_hashes.update((job.job_hash, now_ts) for job in new_jobs)
+                self._known_hashes.update((job_hash, now_ts) for _, job_hash in existing)
+                return new_jobs
+            
+            except sqlite3.Error as e:
+                logger.error(f"Error adding jobs: {e}")
+                self.conn.rollback()
+                return []
+            finally:
+                cursor.close()
     
     def get_job_by_hash(self, job_hash: str) -> Optional[Job]:
         """Get a job by its hash."""
-        cursor = self.conn.cursor()
-        
         try:
-            cursor.execute("SELECT * FROM jobs WHERE job_hash = ?", (job_hash,))
-            row = cursor.fetchone()
+            row = self._ro.execute(GET_JOB_BY_HASH_SQL, (job_hash,)).fetchone()
             
             if row:
-                return self._row_to_job(row)
+                return job_from_row(row)
             return None
             
         except sqlite3.Error as e:
             logger.error(f"Error getting job by hash: {e}")
             return None
-        finally:
-            cursor.close()
     
     def get_recent_jobs(self, hours: int = 24, limit: int = 50) -> List[Job]:
         """Get jobs found in the last N hours."""
-        cursor = self.conn.cursor()
-        
         try:
-            cutoff_time = datetime.now(timezone.utc).replace(
-                hour=datetime.now(timezone.utc).hour - hours
-            )
-            
-            cursor.execute("""
-                SELECT * FROM jobs 
-                WHERE first_seen > ? 
-                ORDER BY first_seen DESC 
-                LIMIT ?
-            """, (cutoff_time, limit))
+            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
             
-            jobs = []
-            for row in cursor.fetchall():
-                jobs.append(self._row_to_job(row))
+            rows = self._ro.execute(RECENT_JOBS_SQL, (cutoff_time, limit)).fetchall()
             
-            return jobs
+            return list(map(job_from_row, rows))
             
         except sqlite3.Error as e:
             logger.error(f"Error getting recent jobs: {e}")
             return []
-        finally:
-            cursor.close()
     
     def mark_job_notified(self, job_hash: str) -> bool:
         """Mark a job as having been notified."""
-        cursor = self.conn.cursor()
+        return self.mark_jobs_notified([job_hash]) > 0
+    
+    def mark_jobs_notified(self, job_hashes: List[str]) -> int:
+        """
+        Mark a batch of jobs as notified with a single UPDATE.
         
-        try:
-            cursor.execute(
-                "UPDATE jobs SET notified = TRUE WHERE job_hash = ?",
-                (job_hash,)
-            )
-            self.conn.commit()
-            return cursor.rowcount > 0
+        Args:
+            job_hashes: Hashes of the jobs that were sent
+        
+        Returns:
+            Number of jobs updated
+        """
+        if not job_hashes:
+            return 0
+        
+        with self._write_lock:
+            try:
+                return self.conn.execute(MARK_NOTIFIED_SQL, (json.dumps(list(job_hashes)),)).rowcount
             
-        except sqlite3.Error as e:
-            logger.error(f"Error marking job as notified: {e}")
-            self.conn.rollback()
-            return False
-        finally:
-            cursor.close()
+            except sqlite3.Error as e:
+                logger.error(f"Error marking jobs as notified: {e}")
+                return 0
+    
+    def update_job_salaries(self, salaries: List[Tuple[str, str, Optional[int], Optional[int]]]) -> int:
+        """
+        Backfill salary information for stored jobs in a single transaction.
+        
+        Args:
+            salaries: (job_hash, pay_range_text, pay_range_min, pay_range_max) tuples
+        
+        Returns:
+            Number of jobs updated
+        """
+        if not salaries:
+            return 0
+        
+        with self._write_lock:
+            cursor = self.conn.cursor()
+            
+            try:
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.executemany(UPDATE_SALARY_SQL, [
+                    (text, pay_min, pay_max, job_hash) for job_hash, text, pay_min, pay_max in salaries
+                ])
+                updated = cursor.rowcount
+                cursor.execute("COMMIT")
+                return updated
+            
+            except sqlite3.Error as e:
+                logger.error(f"Error updating job salaries: {e}")
+                self.conn.rollback()
+                return 0
+            finally:
+                cursor.close()
     
     def get_unnotified_jobs(self) -> List[Job]:
         """Get all jobs that haven't been notified yet."""
-        cursor = self.conn.cursor()
-        
         try:
-            cursor.execute("SELECT * FROM jobs WHERE notified = FALSE ORDER BY first_seen DESC")
-            
-            jobs = []
-            for row in cursor.fetchall():
-                jobs.append(self._row_to_job(row))
-            
-            return jobs
+            rows = self._ro.execute(UNNOTIFIED_JOBS_SQL).fetchall()
+        
+            return list(map(job_from_row, rows))
             
         except sqlite3.Error as e:
             logger.error(f"Error getting unnotified jobs: {e}")
             return []
-        finally:
-            cursor.close()
     
     def log_search(self, city: str, search_url: str, screenshot_count: int = 0, 
                    jobs_found: int = 0, success: bool = True, error_message: str = None):
         """Log a search attempt to the search history."""
-        cursor = self.conn.cursor()
-        
-        try:
-            cursor.execute("""
-                INSERT INTO search_history (
-                    city, search_url, screenshot_count, jobs_found, success, error_message
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            """, (city, search_url, screenshot_count, jobs_found, success, error_message))
-            
-            self.conn.commit()
+        with self._write_lock:
+            try:
+                self.conn.execute(LOG_SEARCH_SQL, (city, search_url, screenshot_count, jobs_found,
+                                                   success, error_message, datetime.now(timezone.utc)))
             
-        except sqlite3.Error as e:
-            logger.error(f"Error logging search: {e}")
-            self.conn.rollback()
-        finally:
-            cursor.close()
+            except sqlite3.Error as e:
+                logger.error(f"Error logging search: {e}")
     
     def get_stats(self) -> Dict[str, int]:
         """Get database statistics."""
-        cursor = self.conn.cursor()
-        
         try:
-            stats = {}
-            
-            # Total jobs
-            cursor.execute("SELECT COUNT(*) as count FROM jobs")
-            stats['total_jobs'] = cursor.fetchone()['count']
-            
-            # Jobs today
             today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-            cursor.execute("SELECT COUNT(*) as count FROM jobs WHERE first_seen >= ?", (today,))
-            stats['jobs_today'] = cursor.fetchone()['count']
-            
-            # Unnotified jobs
-            cursor.execute("SELECT COUNT(*) as count FROM jobs WHERE notified = FALSE")
-            stats['unnotified_jobs'] = cursor.fetchone()['count']
-            
-            # Total searches
-            cursor.execute("SELECT COUNT(*) as count FROM search_history")
-            stats['total_searches'] = cursor.fetchone()['count']
-            
-            # Successful searches today
-            cursor.execute("""
-                SELECT COUNT(*) as count FROM search_history 
-                WHERE timestamp >= ? AND success = TRUE
-            """, (today,))
-            stats['successful_searches_today'] = cursor.fetchone()['count']
+        
+            # One pass over each table using conditional aggregation
+            total_jobs, jobs_today, unnotified_jobs = self._ro.execute("""
+                SELECT
+                    COUNT(*),
+                    COALESCE(SUM(first_seen >= ?), 0),
+                    COALESCE(SUM(notified = FALSE), 0)
+                FROM jobs
+            """, (today,)).fetchone()
+            
+            total_searches, successful_searches_today = self._ro.execute("""
+                SELECT
+                    COUNT(*),
+                    COALESCE(SUM(timestamp >= ? AND success = TRUE), 0)
+                FROM search_history
+            """, (today,)).fetchone()
             
-            return stats
+            return {
+                'total_jobs': total_jobs,
+                'jobs_today': jobs_today,
+                'unnotified_jobs': unnotified_jobs,
+                'total_searches': total_searches,
+                'successful_searches_today': successful_searches_today
+            }
             
         except sqlite3.Error as e:
             logger.error(f"Error getting stats: {e}")
             return {}
-        finally:
-            cursor.close()
     
     def cleanup_old_jobs(self, days_old: int = 3) -> int:
         """
@@ -365,7 +617,7 @@ class JobDatabase:
         
         Args:
             days_old: Number of days after which to delete jobs (default 3)
-            
+        
         Returns:
             Number of jobs deleted
         """
@@ -375,34 +627,52 @@ class JobDatabase:
             # Calculate cutoff date
             cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_old)
             
-            # First, count how many jobs will be deleted
-            cursor.execute("SELECT COUNT(*) FROM jobs WHERE first_seen < ?", (cutoff_date,))
-            count_to_delete = cursor.fetchone()[0]
+            # Delete old jobs in small batches, each its own autocommitted
+            # statement, taking the write lock per batch so a concurrent
+            # search never waits long to get in
+            count_to_delete = 0
+            while True:
+                with self._write_lock:
+                    cursor.execute("""
+                        DELETE FROM jobs WHERE job_hash IN (
+                            SELECT job_hash FROM jobs WHERE first_seen < ? LIMIT ?
+                        )
+                        RETURNING job_hash
+                    """, (cutoff_date, CLEANUP_BATCH_SIZE))
+                    deleted_hashes = [row[0] for row in cursor.fetchall()]
+                    for job_hash in deleted_hashes:
+                        self._known_hashes.pop(job_hash, None)
+                deleted = len(deleted_hashes)
+                count_to_delete += deleted
+                
+                if deleted < CLEANUP_BATCH_SIZE:
+                    break
+                time.sleep(0.05)
+            
+            with self._write_lock:
+                # Search history ages out on the same schedule as jobs
+                cursor.execute("DELETE FROM search_history WHERE timestamp < ?", (cutoff_date,))
             
             if count_to_delete > 0:
-                # Delete old jobs
-                cursor.execute("DELETE FROM jobs WHERE first_seen < ?", (cutoff_date,))
-                
-                # Also clean up old search logs
-                cursor.execute("DELETE FROM search_logs WHERE search_time < ?", (cutoff_date,))
-                
-                self.conn.commit()
                 logger.info(f"🗑️ Cleaned up {count_to_delete} jobs older than {days_old} days")
             else:
                 logger.debug(f"No jobs older than {days_old} days to clean up")
             
-            return count_to_delete
+            # Fold the WAL back into the main file so it doesn't grow unbounded
+            with self._write_lock:
+                cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
             
+            return count_to_delete
+        
         except sqlite3.Error as e:
             logger.error(f"Error during database cleanup: {e}")
-            self.conn.rollback()
             return 0
         finally:
             cursor.close()
     
     def get_database_size_info(self) -> Dict:
         """Get database size information."""
-        cursor = self.conn.cursor()
+        cursor = self._ro.cursor()
         
         try:
             # Get job count
@@ -412,11 +682,10 @@ class JobDatabase:
             # Get oldest and newest jobs
             cursor.execute("SELECT MIN(first_seen), MAX(first_seen) FROM jobs")
             result = cursor.fetchone()
-            oldest_job = result[0]
-            newest_job = result[1]
+            oldest_job = datetime.fromtimestamp(result[0], tz=timezone.utc).isoformat() if result[0] else None
+            newest_job = datetime.fromtimestamp(result[1], tz=timezone.utc).isoformat() if result[1] else None
             
             # Get database file size
-            import os
             db_size = 0
             if os.path.exists(self.db_path):
                 db_size = os.path.getsize(self.db_path)
@@ -436,6 +705,8 @@ class JobDatabase:
             cursor.close()
     
     def close(self):
-        """Close the database connection."""
+        """Close the database connections."""
+        if self._ro:
+            self._ro.close()
         if self.conn:
             self.conn.close()
\ No newline at end of file
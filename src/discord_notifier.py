@@ -4,22 +4,139 @@ Discord notification module for LinkedIn Job Monitor
 Handles sending job alerts and status updates to Discord via webhooks.
 """
 
+import atexit
 import json
+import math
+import random
+import re
+import threading
+import time
 import requests
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
 from typing import List, Dict, Optional
 import logging
 from pathlib import Path
 
-from database import Job
-from config import config
+from .database import Job
+from .config import config
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:  # orjson is in requirements.txt; stdlib json is the fallback
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+try:
+    from requests_cache import CachedSession
+except ImportError:  # optional; logo checks then use a plain session
+    CachedSession = None
+
+try:
+    from itertools import batched
+except ImportError:  # Python < 3.12
+    def batched(iterable, n):
+        """Yield successive tuples of up to n items from iterable."""
+        iterator = iter(iterable)
+        while batch := tuple(islice(iterator, n)):
+            yield batch
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Webhooks are sent to in parallel; each has its own Discord rate limit bucket
+MAX_WEBHOOK_WORKERS = 4
+
+# 429 handling: retries per message, plus jitter so parallel senders don't retry in lockstep
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_JITTER_SECONDS = 0.25
+
+# Background notifications queued at most this deep; callers block beyond it
+# so an unreachable Discord can't grow the queue without bound
+NOTIFY_QUEUE_MAX = 64
+
+# Background sender for notify_new_job_async, shared by every notifier and
+# drained once on interpreter exit
+_notify_executor = ThreadPoolExecutor(max_workers=MAX_WEBHOOK_WORKERS, thread_name_prefix="discord-notify")
+_notify_queue_slots = threading.BoundedSemaphore(NOTIFY_QUEUE_MAX)
+atexit.register(_notify_executor.shutdown, wait=True)
+
+# Recently notified jobs remembered so a repeated call doesn't re-post them
+NOTIFY_CACHE_MAX = 5000
+
+# Payloads are pre-serialized to bytes, so the content type is set explicitly
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+_WEBHOOK_RE = re.compile(r'^https://discord\.com/api/webhooks/\d+/[\w\-]+$')
+
+# Trailing business suffixes ("Acme Co. Inc.") and anything that can't be in a domain
+_LOGO_SUFFIX_RE = re.compile(r'(?:\s+(?:inc\.?|llc|ltd|corp(?:oration)?|co\.?|company))+$')
+_LOGO_STRIP_RE = re.compile(r'[^a-z0-9]')
+_GENERIC_LOGO_URL = "https://cdn-icons-png.flaticon.com/512/3135/3135715.png"  # Generic building icon
+_CLEARBIT_LOGO_PREFIX = "https://logo.clearbit.com/"
+
+# Clearbit logo checks are cached on disk next to the database for a week
+LOGO_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+# Location type labels for job embeds; unknown types get a pin
+_LOC_TYPE_FMT = {
+    'Remote': "🏠 Remote",
+    'Hybrid': "🏢🏠 Hybrid",
+    'On-site': "On-site"  # No emoji for On-site
+}
+
+# Static embed footers, shared by every payload (they are only ever read)
+_FOOTER_ICON_URL = "https://cdn-icons-png.flaticon.com/512/174/174857.png"
+_JOB_FOOTER = {"text": "LinkedIn Job Monitor • Apply quickly for best results!", "icon_url": _FOOTER_ICON_URL}
+_STATUS_FOOTER = {"text": "LinkedIn Job Monitor", "icon_url": _FOOTER_ICON_URL}
+_SUMMARY_FOOTER = {"text": "LinkedIn Job Monitor - Daily Summary", "icon_url": _FOOTER_ICON_URL}
+
+# Daily summary location breakdown: (stats key, emoji, label)
+_SUMMARY_LOCATION_TYPES = (
+    ('remote_jobs', "🏠", "Remote"),
+    ('hybrid_jobs', "🏢🏠", "Hybrid"),
+    ('onsite_jobs', "🏢", "On-site")
+)
+
+def _notify_key(job: Job) -> str:
+    """Dedupe key for a notified job; jobs without a LinkedIn ID fall back to their hash."""
+    return job.linkedin_job_id or job.job_hash
+
+
+@lru_cache(maxsize=1024)
+def _company_logo_url(company_name: str) -> str:
+    """Build the Clearbit logo URL for a company; cached since it's a pure function of the name."""
+    if not company_name:
+        return _GENERIC_LOGO_URL
+    
+    try:
+        # Clean company name for domain generation: drop business suffixes,
+        # then special characters and spaces
+        clean_name = _LOGO_SUFFIX_RE.sub('', company_name.lower().strip())
+        clean_name = _LOGO_STRIP_RE.sub('', clean_name)
+        
+        # Generate domain (most common pattern)
+        if clean_name:
+            domain = f"{clean_name}.com"
+            return f"{_CLEARBIT_LOGO_PREFIX}{domain}"
+        else:
+            return _GENERIC_LOGO_URL
+    
+    except Exception as e:
+        logger.debug(f"Error generating logo URL for {company_name}: {e}")
+        return _GENERIC_LOGO_URL
+
 class DiscordNotifier:
     """Handle Discord notifications for job alerts."""
     
+    _VALID_CITIES = frozenset({'NYC', 'LA', 'SF', 'SD', 'Remote'})
+    
     def __init__(self, webhook_url: str = None):
         """
         Initialize Discord notifier.
@@ -43,19 +160,52 @@ class DiscordNotifier:
             'info': 0x0099ff,         # Blue for info
             'warning': 0xffaa00       # Orange for warnings
         }
+        
+        # City -> resolved webhook URL; webhook config is fixed for the process
+        self._resolved_webhook_cache: Dict[str, Optional[str]] = {}
+        
+        # Per-webhook rate limit state: URL -> monotonic time its bucket resets
+        self._rate_limit_resets = {}
+        
+        # LRU of recently notified job keys (see _notify_key), oldest first;
+        # locked because notify_jobs sends from several threads
+        self._notified: "OrderedDict[str, None]" = OrderedDict()
+        self._notified_lock = threading.Lock()
+        
+        # Optional logo verification: Clearbit URL -> URL to actually use
+        self._logo_session = self._create_logo_session() if config.verify_company_logos else None
+        self._verified_logos: Dict[str, str] = {}
+        
+        # Pooled keep-alive session so a cycle's status + job POSTs share
+        # connections to discord.com instead of a TLS handshake per message.
+        # Failed connects and transient 5xx responses are retried here; 429s
+        # are handled by the rate limit logic in _attempt_webhook_send.
+        self._session = requests.Session()
+        self._session.headers['Connection'] = 'keep-alive'
+        self._session.mount('https://', HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,  # room for every webhook sender thread plus status posts
+            max_retries=Retry(
+                total=3,
+                read=0,  # a read error may follow an accepted POST - resending would duplicate the message
+                other=0,
+                backoff_factor=1.0,
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=None,  # status retries only: a 5xx means the message wasn't posted
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        ))
     
     def _validate_webhook_urls(self):
         """Validate that webhook URLs are properly formatted Discord webhooks."""
-        import re
-        discord_webhook_pattern = r'^https://discord\.com/api/webhooks/\d+/[\w\-]+$'
-        
         # Validate main webhook
-        if self.webhook_url and not re.match(discord_webhook_pattern, self.webhook_url):
+        if self.webhook_url and not _WEBHOOK_RE.match(self.webhook_url):
             logger.warning("Main Discord webhook URL format appears invalid")
         
         # Validate city webhooks
         for city, url in self.city_webhooks.items():
-            if url and not re.match(discord_webhook_pattern, url):
+            if url and not _WEBHOOK_RE.match(url):
                 logger.warning(f"Discord webhook URL for {city} appears invalid")
     
     def _sanitize_text(self, text: str, max_length: int = 1000) -> str:
@@ -63,7 +213,9 @@ class DiscordNotifier:
         if not text:
             return ""
         
-        # Remove or escape potential markdown injection
+        # Remove or escape potential markdown injection. Chained str.replace
+        # beats str.translate and re.sub here: each pass is a C-level scan,
+        # and a pass with nothing to replace returns the string uncopied
         sanitized = str(text).replace('`', '\\`').replace('*', '\\*').replace('_', '\\_')
         
         # Limit length
@@ -82,54 +234,123 @@ class DiscordNotifier:
         Returns:
             Logo URL or fallback icon
         """
-        if not company_name:
-            return "https://cdn-icons-png.flaticon.com/512/3135/3135715.png"  # Generic building icon
+        logo_url = _company_logo_url(company_name)
+        if self._logo_session is None or not logo_url.startswith(_CLEARBIT_LOGO_PREFIX):
+            return logo_url
+        
+        verified = self._verified_logos.get(logo_url)
+        if verified is None:
+            verified = self._verified_logos[logo_url] = self._verify_logo_url(logo_url)
+        return verified
+    
+    def _create_logo_session(self) -> requests.Session:
+        """Session for logo HEAD checks, backed by a SQLite cache when requests_cache is installed."""
+        if CachedSession is None:
+            logger.warning("⚠️ requests_cache not installed - logo checks are only cached in memory")
+            return requests.Session()
+        
+        cache_path = Path(config.database_path).parent / 'logo_cache.sqlite'
+        return CachedSession(
+            str(cache_path),
+            backend='sqlite',
+            expire_after=LOGO_CACHE_TTL_SECONDS,
+            allowable_methods=('HEAD',),
+            allowable_codes=(200, 404)  # cache misses too, so they aren't rechecked every run
+        )
+    
+    def _verify_logo_url(self, logo_url: str) -> str:
+        """
+        Check that a Clearbit logo exists, falling back to the generic icon.
+        
+        Args:
+            logo_url: Clearbit logo URL
         
+        Returns:
+            The logo URL if it resolves, otherwise the generic icon URL
+        """
         try:
-            # Clean company name for domain generation
-            clean_name = company_name.lower()
-            
-            # Remove common business suffixes
-            suffixes = [' inc.', ' inc', ' llc', ' ltd', ' corporation', ' corp', ' co.', ' company']
-            for suffix in suffixes:
-                clean_name = clean_name.replace(suffix, '')
-            
-            # Remove special characters and spaces
-            clean_name = ''.join(char for char in clean_name if char.isalnum() or char == ' ')
-            clean_name = clean_name.strip().replace(' ', '')
-            
-            # Generate domain (most common pattern)
-            if clean_name:
-                domain = f"{clean_name}.com"
-                return f"https://logo.clearbit.com/{domain}"
-            else:
-                return "https://cdn-icons-png.flaticon.com/512/3135/3135715.png"
-                
-        except Exception as e:
-            logger.debug(f"Error generating logo URL for {company_name}: {e}")
-            return "https://cdn-icons-png.flaticon.com/512/3135/3135715.png"
+            response = self._logo_session.head(logo_url, timeout=3, allow_redirects=True)
+        except requests.exceptions.RequestException as e:
+            # Don't blame the company for a network hiccup; keep the logo
+            logger.debug(f"Logo check failed for {logo_url}: {e}")
+            return logo_url
+        
+        return logo_url if response.status_code < 400 else _GENERIC_LOGO_URL
     
     def get_webhook_for_city(self, city: str) -> str:
         """Get the appropriate webhook URL for a city."""
+        try:
+            return self._resolved_webhook_cache[city]
+        except KeyError:
+            pass
+        
         # Validate city input
-        valid_cities = {'NYC', 'LA', 'SF', 'SD', 'Remote'}
-        if city not in valid_cities:
+        if city not in self._VALID_CITIES:
             logger.warning(f"Invalid city '{city}', using main webhook")
-            return self.webhook_url
+            webhook_url = self.webhook_url
+        else:
+            # Try city-specific webhook first, then fall back to main webhook
+            webhook_url = self.city_webhooks.get(city) or self.webhook_url
         
-        # Try city-specific webhook first
-        if city in self.city_webhooks and self.city_webhooks[city]:
-            return self.city_webhooks[city]
+        self._resolved_webhook_cache[city] = webhook_url
+        return webhook_url
+    
+    def _format_salary(self, job: Job) -> str:
+        """Salary text: LinkedIn's own wording when present, otherwise the parsed range."""
+        if job.pay_range_text:
+            # Clean up LinkedIn's original text formatting and normalize whitespace
+            return ' '.join(self._sanitize_text(job.pay_range_text.strip(), 100).split())
         
-        # Fall back to main webhook
-        return self.webhook_url
+        # Format as clean range with proper spacing, or only the minimum
+        if job.pay_range_max:
+            salary_text = f"${job.pay_range_min:,} - ${job.pay_range_max:,}"
+        else:
+            salary_text = f"${job.pay_range_min:,}+"
+        if job.pay_type and job.pay_type != 'yearly':
+            salary_text += f" {job.pay_type}"
+        return salary_text
+    
+    def _format_location(self, job: Job) -> str:
+        """Location text with its type (no emoji for On-site)."""
+        if not job.location_type:
+            return self._sanitize_text(job.location, 100)
+        
+        location_text = _LOC_TYPE_FMT.get(job.location_type) or f"📍 {job.location_type}"
+        if job.location and job.location_type not in job.location:
+            location_text += f" • {self._sanitize_text(job.location, 100)}"
+        return location_text
+    
+    def _format_posted(self, job: Job) -> str:
+        """Posted time, flagged when the job is very recent."""
+        if job.posted_hours_ago is None:
+            return job.posted_time
+        if job.posted_hours_ago < 1:
+            return f"{job.posted_time} ⚡ (Very Recent!)"
+        if job.posted_hours_ago <= 24:
+            return f"{job.posted_time} 🔥 (Hot!)"
+        return job.posted_time
+    
+    # Job embed fields in display order as (name, formatter, inline, predicate);
+    # fields whose predicate is false are left out instead of showing a placeholder
+    _JOB_FIELD_SPECS = (
+        ("💰 Salary", _format_salary, True, lambda job: job.pay_range_text or job.pay_range_min),
+        ("📍 Location", _format_location, True, lambda job: job.location or job.location_type),
+        ("🕒 Posted", _format_posted, True, lambda job: job.posted_time),
+        # Prominent application link (webhooks don't support buttons);
+        # zero-width space for an invisible field name
+        ("\u200b", lambda self, job: f"**[➤ APPLY ON LINKEDIN]({job.linkedin_url})**", False,
+         lambda job: job.linkedin_url and 'linkedin.com' in job.linkedin_url),
+        # Job ID for reference (small text)
+        ("🆔 Job ID", lambda self, job: f"`{job.linkedin_job_id}`", True, lambda job: job.linkedin_job_id),
+    )
     
-    def _create_job_embed(self, job: Job) -> Dict:
+    def _create_job_embed(self, job: Job, now_iso: Optional[str] = None) -> Dict:
         """
         Create enhanced Discord embed for a job posting with all available data.
         
         Args:
             job: Job object with enhanced fields
+            now_iso: Embed timestamp; callers building a batch pass one shared value
             
         Returns:
             Discord embed dictionary with comprehensive job information
@@ -148,11 +369,11 @@ class DiscordNotifier:
         # Get company logo
         company_logo_url = self._get_company_logo_url(safe_company)
         
-        embed = {
+        return {
             "title": f"{safe_title}",
             "description": f"**{safe_company}**",
             "color": embed_color,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso or datetime.now(timezone.utc).isoformat(),
             "thumbnail": {
                 "url": company_logo_url
             },
@@ -160,96 +381,13 @@ class DiscordNotifier:
                 "name": safe_company,
                 "icon_url": company_logo_url
             },
-            "fields": [],
-            "footer": {
-                "text": "LinkedIn Job Monitor • Apply quickly for best results!",
-                "icon_url": "https://cdn-icons-png.flaticon.com/512/174/174857.png"
-            }
+            "fields": [
+                {"name": name, "value": fmt(self, job), "inline": inline}
+                for name, fmt, inline, present in self._JOB_FIELD_SPECS
+                if present(job)
+            ],
+            "footer": _JOB_FOOTER
         }
-        
-        # Add salary information with proper formatting
-        if job.pay_range_text:
-            # Clean up LinkedIn's original text formatting
-            salary_text = self._sanitize_text(job.pay_range_text.strip(), 100)
-            # Remove extra whitespace and normalize
-            salary_text = ' '.join(salary_text.split())
-        elif job.pay_range_min and job.pay_range_max:
-            # Format as clean range with proper spacing
-            salary_text = f"${job.pay_range_min:,} - ${job.pay_range_max:,}"
-            if job.pay_type and job.pay_type != 'yearly':
-                salary_text += f" {job.pay_type}"
-        elif job.pay_range_min:
-            # Only minimum available
-            salary_text = f"${job.pay_range_min:,}+"
-            if job.pay_type and job.pay_type != 'yearly':
-                salary_text += f" {job.pay_type}"
-        else:
-            salary_text = "Not disclosed"
-        
-        embed["fields"].append({
-            "name": "💰 Salary",
-            "value": salary_text,
-            "inline": True
-        })
-        
-        # Add location with type (no emoji for On-site)
-        location_text = ""
-        if job.location_type:
-            # Use emojis for location type (except On-site)
-            if job.location_type == 'Remote':
-                location_text = f"🏠 {job.location_type}"
-            elif job.location_type == 'Hybrid':
-                location_text = f"🏢🏠 {job.location_type}"
-            elif job.location_type == 'On-site':
-                location_text = job.location_type  # No emoji for On-site
-            else:
-                location_text = f"📍 {job.location_type}"
-                
-            if job.location and job.location_type not in job.location:
-                safe_location = self._sanitize_text(job.location, 100)
-                location_text += f" • {safe_location}"
-        else:
-            location_text = self._sanitize_text(job.location, 100) if job.location else "Not specified"
-        
-        embed["fields"].append({
-            "name": "📍 Location",
-            "value": location_text,
-            "inline": True
-        })
-        
-        # Add posted time
-        posted_text = "Recently posted"
-        if job.posted_time:
-            posted_text = job.posted_time
-            if job.posted_hours_ago is not None:
-                if job.posted_hours_ago < 1:
-                    posted_text += " ⚡ (Very Recent!)"
-                elif job.posted_hours_ago <= 24:
-                    posted_text += " 🔥 (Hot!)"
-        
-        embed["fields"].append({
-            "name": "🕒 Posted",
-            "value": posted_text,
-            "inline": True
-        })
-        
-        # Add prominent application link (webhooks don't support buttons)
-        if job.linkedin_url and 'linkedin.com' in job.linkedin_url:
-            embed["fields"].append({
-                "name": "\u200b",  # Zero-width space for invisible field name
-                "value": f"**[➤ APPLY ON LINKEDIN]({job.linkedin_url})**",
-                "inline": False
-            })
-        
-        # Add job ID for reference (small text)
-        if job.linkedin_job_id:
-            embed["fields"].append({
-                "name": "🆔 Job ID",
-                "value": f"`{job.linkedin_job_id}`",
-                "inline": True
-            })
-        
-        return embed
     
     def _send_webhook(self, payload: Dict, webhook_url: str = None) -> bool:
         """
@@ -292,11 +430,35 @@ class DiscordNotifier:
                 logger.error("No webhook URL provided")
                 return False
             
-            response = requests.post(
+            # Serialize once; retries below resend the same bytes
+            body = _dumps(payload)
+            
+            # Wait out an exhausted rate limit bucket instead of getting a 429
+            self._wait_for_rate_limit(url)
+            
+            response = self._session.post(
                 url,
-                json=payload,
+                data=body,
+                headers=_JSON_HEADERS,
                 timeout=30
             )
+            self._update_rate_limit(url, response)
+            
+            # Rate limited anyway: sleep for the time Discord asks for and retry
+            for _ in range(RATE_LIMIT_RETRIES):
+                if response.status_code != 429:
+                    break
+                retry_after = self._get_retry_after(response) + random.uniform(0, RATE_LIMIT_JITTER_SECONDS)
+                logger.warning(f"Discord webhook rate limited, retrying in {retry_after:.2f}s")
+                time.sleep(retry_after)
+                
+                response = self._session.post(
+                    url,
+                    data=body,
+                    headers=_JSON_HEADERS,
+                    timeout=30
+                )
+                self._update_rate_limit(url, response)
             
             if response.status_code == 204:
                 logger.info("Discord notification sent successfully")
@@ -309,6 +471,36 @@ class DiscordNotifier:
             logger.error(f"Error sending Discord webhook: {e}")
             return False
     
+    def _wait_for_rate_limit(self, url: str):
+        """Sleep until the webhook's rate limit bucket resets if it is exhausted."""
+        reset_at = self._rate_limit_resets.pop(url, None)
+        if reset_at is not None:
+            delay = reset_at - time.monotonic()
+            if delay > 0:
+                logger.info(f"Discord rate limit bucket exhausted, waiting {delay:.2f}s")
+                time.sleep(delay)
+    
+    def _update_rate_limit(self, url: str, response: requests.Response):
+        """Record when the webhook's bucket resets if the response says it is exhausted."""
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset_after = response.headers.get('X-RateLimit-Reset-After')
+        
+        if remaining == '0' and reset_after:
+            try:
+                self._rate_limit_resets[url] = time.monotonic() + float(reset_after)
+            except ValueError:
+                pass
+    
+    def _get_retry_after(self, response: requests.Response) -> float:
+        """Get the retry delay in seconds from a 429 response."""
+        try:
+            return float(response.json()['retry_after'])
+        except (ValueError, KeyError, TypeError):
+            try:
+                return float(response.headers.get('Retry-After', 1))
+            except ValueError:
+                return 1.0
+    
     def notify_new_job(self, job: Job) -> bool:
         """
         Send notification for a new job.
@@ -319,6 +511,10 @@ class DiscordNotifier:
         Returns:
             True if notification sent successfully
         """
+        if _notify_key(job) in self._notified:
+            logger.info(f"⏭️ Skipping already-notified job: {job.title} at {job.company}")
+            return True
+        
         city = getattr(job, 'city', 'Unknown')
         logger.info(f"Sending Discord notification for new job in {city}: {job.title} at {job.company}")
         
@@ -331,7 +527,31 @@ class DiscordNotifier:
         
         # Use city-specific webhook
         webhook_url = self.get_webhook_for_city(city)
-        return self._send_webhook(payload, webhook_url)
+        success = self._send_webhook(payload, webhook_url)
+        if success:
+            self._remember_notified([job])
+        return success
+    
+    def notify_new_job_async(self, job: Job) -> Future:
+        """
+        Queue a new job notification and return without waiting for Discord.
+        
+        Blocks only when NOTIFY_QUEUE_MAX notifications are already pending.
+        
+        Args:
+            job: Job object
+        
+        Returns:
+            Future resolving to whether the notification was sent successfully
+        """
+        _notify_queue_slots.acquire()
+        try:
+            future = _notify_executor.submit(self.notify_new_job, job)
+        except BaseException:
+            _notify_queue_slots.release()
+            raise
+        future.add_done_callback(lambda _: _notify_queue_slots.release())
+        return future
     
     def notify_multiple_jobs(self, jobs: List[Job], city: str = None) -> bool:
         """
@@ -354,34 +574,148 @@ class DiscordNotifier:
         # Get city-specific webhook
         webhook_url = self.get_webhook_for_city(target_city)
         
+        return self._send_job_batches(jobs, target_city, webhook_url)
+    
+    def notify_jobs(self, jobs_by_city: Dict[str, List[Job]]) -> Dict[str, bool]:
+        """
+        Send notifications for new jobs across several cities.
+        
+        Cities that route to the same webhook (e.g. several cities falling back
+        to the main webhook) share messages, so each webhook receives
+        ceil(jobs / 10) POSTs rather than at least one per city. Different
+        webhooks are sent to concurrently, so the run takes about as long as
+        the busiest webhook rather than the sum of all of them.
+        
+        Args:
+            jobs_by_city: Mapping of city to its new jobs
+        
+        Returns:
+            Mapping of city to whether its jobs were sent successfully
+        """
+        # Group cities by the webhook their jobs are routed to
+        cities_by_webhook = {}
+        for city, jobs in jobs_by_city.items():
+            if jobs:
+                cities_by_webhook.setdefault(self.get_webhook_for_city(city), []).append(city)
+        
+        if not cities_by_webhook:
+            return {}
+        
+        def send(webhook_url: str, cities: List[str]) -> bool:
+            jobs = [job for city in cities for job in jobs_by_city[city]]
+            logger.info(f"Sending Discord notification for {len(jobs)} new jobs in {', '.join(cities)}")
+            return self._send_job_batches(jobs, ", ".join(cities), webhook_url)
+            
+        # Batches for one webhook stay in order on one thread
+        with ThreadPoolExecutor(max_workers=min(MAX_WEBHOOK_WORKERS, len(cities_by_webhook))) as executor:
+            futures = {
+                executor.submit(send, webhook_url, cities): cities
+                for webhook_url, cities in cities_by_webhook.items()
+            }
+        
+        results = {}
+        for future, cities in futures.items():
+            success = future.result()
+            for city in cities:
+                results[city] = success
+        
+        return results
+    
+    def notify_jobs_by_city(self, jobs: List[Job]) -> Dict[str, bool]:
+        """
+        Send notifications for a flat list of jobs from any number of cities.
+        
+        Jobs are grouped by their city in one pass and handed to notify_jobs,
+        so every webhook is sent to concurrently.
+        
+        Args:
+            jobs: List of Job objects
+        
+        Returns:
+            Mapping of city to whether its jobs were sent successfully
+        """
+        jobs_by_city = defaultdict(list)
+        for job in jobs:
+            jobs_by_city[getattr(job, 'city', 'Unknown')].append(job)
+        
+        return self.notify_jobs(jobs_by_city)
+    
+    def _send_job_batches(self, jobs: List[Job], location_label: str, webhook_url: str) -> bool:
+        """
+        Send jobs to a webhook in messages of up to 10 embeds each.
+        
+        Args:
+            jobs: List of Job objects
+            location_label: City (or cities) named in the message header
+            webhook_url: Webhook URL to send to
+        
+        Returns:
+            True if every batch was sent successfully
+        """
+        jobs = self._filter_notified(jobs)
+        if not jobs:
+            return True
+        
         # Discord has a limit of 10 embeds per message
         max_embeds = 10
-        job_batches = [jobs[i:i + max_embeds] for i in range(0, len(jobs), max_embeds)]
+        batch_count = math.ceil(len(jobs) / max_embeds)
+        
+        # Every embed in this send shares one timestamp
+        now_iso = datetime.now(timezone.utc).isoformat()
         
         success = True
-        for i, batch in enumerate(job_batches):
-            embeds = [self._create_job_embed(job) for job in batch]
+        for i, batch in enumerate(batched(jobs, max_embeds)):
+            embeds = [self._create_job_embed(job, now_iso) for job in batch]
             
-            content = f"🚨 **{len(batch)} New Product Position{'s' if len(batch) > 1 else ''} Found in {target_city}!**"
-            if len(job_batches) > 1:
-                content += f" (Batch {i + 1}/{len(job_batches)})"
+            content = f"🚨 **{len(batch)} New Product Position{'s' if len(batch) > 1 else ''} Found in {location_label}!**"
+            if batch_count > 1:
+                content += f" (Batch {i + 1}/{batch_count})"
             
             payload = {
                 "content": content,
                 "embeds": embeds
             }
             
-            # Send to city-specific webhook
+            # Send to city-specific webhook; pacing comes from the webhook's
+            # rate limit headers (see _wait_for_rate_limit), not a fixed sleep
             batch_success = self._send_webhook(payload, webhook_url)
+            if batch_success:
+                self._remember_notified(batch)
             success = success and batch_success
-            
-            # Rate limiting: Discord allows 30 requests per minute
-            if i < len(job_batches) - 1:
-                import time
-                time.sleep(2)  # Wait 2 seconds between batches
         
         return success
     
+    def _filter_notified(self, jobs: List[Job]) -> List[Job]:
+        """
+        Drop jobs that were already notified or repeat earlier in the list.
+        
+        Args:
+            jobs: List of Job objects
+        
+        Returns:
+            Jobs that still need a notification, in their original order
+        """
+        seen = set()
+        fresh = []
+        for job in jobs:
+            key = _notify_key(job)
+            if key not in seen and key not in self._notified:
+                seen.add(key)
+                fresh.append(job)
+        
+        if len(fresh) < len(jobs):
+            logger.info(f"⏭️ Skipping {len(jobs) - len(fresh)} already-notified jobs")
+        
+        return fresh
+    
+    def _remember_notified(self, jobs: List[Job]):
+        """Record jobs as notified, evicting the oldest entries past NOTIFY_CACHE_MAX."""
+        with self._notified_lock:
+            for job in jobs:
+                self._notified[_notify_key(job)] = None
+            while len(self._notified) > NOTIFY_CACHE_MAX:
+                self._notified.popitem(last=False)
+    
     def notify_status(self, title: str, message: str, status_type: str = 'info') -> bool:
         """
         Send a status notification.
@@ -410,11 +744,8 @@ class DiscordNotifier:
             "title": f"{emoji} {title}",
             "description": message,
             "color": color,
-            "timestamp": datetime.utcnow().isoformat(),
-            "footer": {
-                "text": "LinkedIn Job Monitor",
-                "icon_url": "https://cdn-icons-png.flaticon.com/512/174/174857.png"
-            }
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "footer": _STATUS_FOOTER
         }
         
         payload = {
@@ -443,82 +774,46 @@ class DiscordNotifier:
         
         # Enhanced stats if available
         jobs_with_salary = stats.get('jobs_with_salary', 0)
-        remote_jobs = stats.get('remote_jobs', 0)
-        hybrid_jobs = stats.get('hybrid_jobs', 0)
-        onsite_jobs = stats.get('onsite_jobs', 0)
         avg_salary_min = stats.get('avg_salary_min')
         avg_salary_max = stats.get('avg_salary_max')
         
-        embed = {
-            "title": "📊 Daily Job Search Summary",
-            "color": self.colors['info'],
-            "timestamp": datetime.utcnow().isoformat(),
-            "fields": [
-                {
-                    "name": "🆕 New Jobs Today",
-                    "value": f"**{jobs_today}** new positions",
-                    "inline": True
-                },
-                {
-                    "name": "📊 Total in Database",
-                    "value": f"**{total_jobs}** jobs tracked",
-                    "inline": True
-                },
-                {
-                    "name": "🔍 Searches Today",
-                    "value": f"**{searches_today}** searches",
-                    "inline": True
-                }
-            ],
-            "footer": {
-                "text": "LinkedIn Job Monitor - Daily Summary",
-                "icon_url": "https://cdn-icons-png.flaticon.com/512/174/174857.png"
-            }
-        }
+        salary_text = f"**{jobs_with_salary}** jobs with disclosed salary"
+        if avg_salary_min and avg_salary_max:
+            salary_text += f"\n💰 Avg Range: ${avg_salary_min:,.0f} - ${avg_salary_max:,.0f}"
         
-        # Add salary information if available
-        if jobs_with_salary > 0:
-            salary_text = f"**{jobs_with_salary}** jobs with disclosed salary"
-            if avg_salary_min and avg_salary_max:
-                salary_text += f"\n💰 Avg Range: ${avg_salary_min:,.0f} - ${avg_salary_max:,.0f}"
-            
-            embed["fields"].append({
-                "name": "💰 Salary Data",
-                "value": salary_text,
-                "inline": False
-            })
-        
-        # Add location type breakdown
-        if remote_jobs + hybrid_jobs + onsite_jobs > 0:
-            location_breakdown = []
-            if remote_jobs > 0:
-                location_breakdown.append(f"🏠 **{remote_jobs}** Remote")
-            if hybrid_jobs > 0:
-                location_breakdown.append(f"🏢🏠 **{hybrid_jobs}** Hybrid")
-            if onsite_jobs > 0:
-                location_breakdown.append(f"🏢 **{onsite_jobs}** On-site")
-            
-            embed["fields"].append({
-                "name": "📍 Location Types",
-                "value": " • ".join(location_breakdown),
-                "inline": False
-            })
-        
-        # Add notification status
-        if unnotified > 0:
-            embed["fields"].append({
-                "name": "🔔 Pending Notifications",
-                "value": f"**{unnotified}** jobs awaiting notification",
-                "inline": True
-            })
+        # Location type breakdown, leaving out types with no jobs
+        location_breakdown = " • ".join(
+            f"{emoji} **{count}** {label}"
+            for key, emoji, label in _SUMMARY_LOCATION_TYPES
+            if (count := stats.get(key, 0)) > 0
+        )
         
         # Add performance tip
         if jobs_today > 0:
-            embed["description"] = "🎯 **Great day for job hunting!** Apply quickly for the best results."
+            description = "🎯 **Great day for job hunting!** Apply quickly for the best results."
         elif searches_today > 0:
-            embed["description"] = "🔍 **Monitoring active** - No new matches today, but we're watching!"
+            description = "🔍 **Monitoring active** - No new matches today, but we're watching!"
         else:
-            embed["description"] = "💤 **Quiet day** - System may need attention or LinkedIn changes detected."
+            description = "💤 **Quiet day** - System may need attention or LinkedIn changes detected."
+        
+        embed = {
+            "title": "📊 Daily Job Search Summary",
+            "color": self.colors['info'],
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "fields": [
+                {"name": "🆕 New Jobs Today", "value": f"**{jobs_today}** new positions", "inline": True},
+                {"name": "📊 Total in Database", "value": f"**{total_jobs}** jobs tracked", "inline": True},
+                {"name": "🔍 Searches Today", "value": f"**{searches_today}** searches", "inline": True},
+                *([{"name": "💰 Salary Data", "value": salary_text, "inline": False}]
+                  if jobs_with_salary > 0 else []),
+                *([{"name": "📍 Location Types", "value": location_breakdown, "inline": False}]
+                  if location_breakdown else []),
+                *([{"name": "🔔 Pending Notifications", "value": f"**{unnotified}** jobs awaiting notification", "inline": True}]
+                  if unnotified > 0 else [])
+            ],
+            "footer": _SUMMARY_FOOTER,
+            "description": description
+        }
         
         payload = {
             "content": "📅 **Daily Summary Report**",
@@ -4,23 +4,335 @@ LinkedIn monitoring module
 Coordinates MCP server communication, screenshot capture, and job extraction.
 """
 
-import json
+import re
 import time
+import random
 import logging
+import threading
 import requests
-from datetime import datetime, timezone
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from datetime import datetime
 from typing import List, Dict, Optional, Tuple
-from pathlib import Path
-from bs4 import BeautifulSoup
-from urllib.parse import quote
+from bs4 import BeautifulSoup, UnicodeDammit
+from html.parser import HTMLParser
+from urllib.parse import urlencode, quote_plus
 
-from config import config, LinkedInURLBuilder
-from database import JobDatabase, Job
-from discord_notifier import DiscordNotifier
+from .config import config
+from .database import JobDatabase, Job
+from .discord_notifier import DiscordNotifier
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Upper bound on cities searched concurrently - kept low, along with a random
+# delay between city requests, so the fan-out doesn't look like a bot burst
+MAX_SEARCH_WORKERS = 2
+SEARCH_JITTER_SECONDS = (1.0, 3.0)
+
+# LinkedIn geoId for each searchable city
+_LOCATION_IDS = {
+    'NYC': '90000070',   # New York City Area
+    'LA': '90000049',    # Los Angeles Area
+    'SF': '90000084',    # San Francisco Bay Area
+    'SD': '90010472',    # San Diego Area
+    'REMOTE': '90000072' # Remote (using US as fallback)
+}
+
+# Request headers, built once: search pages look like manual browsing, job
+# pages only need a browser user agent. Only encodings requests can decode
+# are offered - "br" needs the optional brotli package
+_USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+_SEARCH_HEADERS = {
+    'User-Agent': _USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': DEFAULT_ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+}
+_JOB_PAGE_HEADERS = {
+    'User-Agent': _USER_AGENT,
+}
+
+# BeautifulSoup backend for job pages: lxml's C parser when installed, the
+# stdlib one otherwise
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
+# Job card elements read by _JobCardParser: (tag, class) -> field.
+# A snippet may be a <p> or a <div>; the <p> wins when both are present
+_CARD_FIELDS = {
+    ('h3', 'base-search-card__title'): 'title',
+    ('h4', 'base-search-card__subtitle'): 'company',
+    ('span', 'job-search-card__location'): 'location',
+    ('a', 'base-card__full-link'): 'link',
+    ('span', 'job-search-card__salary-info'): 'salary',
+    ('p', 'job-search-card__snippet'): 'snippet',
+    ('div', 'job-search-card__snippet'): 'snippet_div',
+}
+
+# Elements that never have an end tag, so never go on the parser's stack
+_VOID_ELEMENTS = frozenset((
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr',
+))
+
+
+class _JobCardParser(HTMLParser):
+    """
+    Streaming parser that turns a search results page into job card records.
+    
+    Parse events are handled as they arrive instead of building a document
+    tree: only the open elements of the current job card are tracked, and
+    each card is flushed to a plain dict as soon as its div closes.
+    
+    Each record maps a field name (see _CARD_FIELDS, plus 'time') to the text
+    of the first matching element in the card; 'link' maps to its href.
+    """
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.cards = []
+        self._card = None
+        self._stack = []   # (tag, field) for each open element in the card
+        self._text = {}    # field -> text chunks, while its element is open
+    
+    def handle_starttag(self, tag, attrs):
+        if tag in _VOID_ELEMENTS:
+            return
+        
+        if self._card is None:
+            if tag == 'div':
+                classes = (dict(attrs).get('class') or '').split()
+                if 'job-search-card' in classes:
+                    self._card = {}
+                    self._stack.append((tag, None))
+            return
+        
+        field = None
+        if tag == 'time':
+            field = 'time'
+        else:
+            for css_class in (dict(attrs).get('class') or '').split():
+                field = _CARD_FIELDS.get((tag, css_class))
+                if field:
+                    break
+        
+        # Only the first element for each field counts
+        if field in self._card or field in self._text:
+            field = None
+        elif field == 'link':
+            self._card['link'] = dict(attrs).get('href') or ''
+            field = None
+        elif field:
+            self._text[field] = []
+        self._stack.append((tag, field))
+    
+    def handle_startendtag(self, tag, attrs):
+        # Self-closing tags carry no text and never contain card fields
+        pass
+    
+    def handle_endtag(self, tag):
+        if self._card is None or not any(open_tag == tag for open_tag, _ in self._stack):
+            return
+        
+        # Pop up to the matching start tag, closing any unclosed children
+        while self._stack:
+            open_tag, field = self._stack.pop()
+            if field:
+                self._card[field] = ''.join(self._text.pop(field))
+            if open_tag == tag:
+                break
+        
+        if not self._stack:
+            self.cards.append(self._card)
+            self._card = None
+    
+    def handle_data(self, data):
+        # Fields can nest (the title sits inside the link), so text goes to
+        # every field whose element is still open
+        for chunks in self._text.values():
+            chunks.append(data)
+
+
+# Opening tag of a job card div, found on the raw markup so cards can be
+# sliced out without parsing the page
+_CARD_START_RE = re.compile(
+    r"""<div\b[^>]*?\bclass\s*=\s*["'][^"']*(?<![\w-])job-search-card(?![\w-])""",
+    re.IGNORECASE
+)
+
+# Every title keyword in _PRODUCT_KEYWORDS contains one of these, so a card
+# mentioning none of them can't be a relevant job and is never parsed
+_CARD_HINTS = ('product', 'apm', 'spm')
+
+
+def _parse_job_cards(html: bytes) -> Tuple[List[Dict[str, str]], int]:
+    """
+    Stream the job cards of a search results page into records.
+    
+    The page is sliced at each card's opening tag and cards without any of
+    _CARD_HINTS in their raw markup are dropped before parsing; most cards
+    in a broad search aren't product roles.
+    
+    Args:
+        html: Raw search page bytes
+    
+    Returns:
+        Tuple of (one dict per parsed job card in page order, see
+        _JobCardParser; number of job cards on the page)
+    """
+    markup = UnicodeDammit(html).unicode_markup
+    starts = [match.start() for match in _CARD_START_RE.finditer(markup)]
+    
+    parser = _JobCardParser()
+    for start, end in zip(starts, starts[1:] + [len(markup)]):
+        card_markup = markup[start:end]
+        card_lower = card_markup.lower()
+        if any(hint in card_lower for hint in _CARD_HINTS):
+            parser.feed(card_markup)
+    parser.close()
+    return parser.cards, len(starts)
+
+# Salary patterns tried in order against job descriptions
+_SALARY_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    # $80,000 - $120,000
+    r'\$[\d,]+\s*[-–—]\s*\$[\d,]+',
+    # $80K - $120K
+    r'\$[\d,]+k?\s*[-–—]\s*\$[\d,]+k?',
+    # 80k - 120k
+    r'[\d,]+k?\s*[-–—]\s*[\d,]+k?(?:\s*(?:per\s+year|annually|salary))?',
+    # Salary: $80,000
+    r'(?:salary|compensation|pay):\s*\$[\d,]+',
+    # Up to $120,000
+    r'up\s+to\s+\$[\d,]+',
+    # Starting at $80,000
+    r'starting\s+(?:at|from)\s+\$[\d,]+',
+    # $25-35/hour or $25-35 per hour
+    r'\$[\d,]+\s*[-–—]\s*\$?[\d,]+\s*(?:/|\s+per\s+)hour',
+    # Hourly rate: $25
+    r'(?:hourly\s+rate|per\s+hour):\s*\$[\d,]+',
+))
+
+# Dollar amounts in salary text ("$80,000" -> "80,000")
+_SALARY_NUMBERS_RE = re.compile(r'\$([\d,]+)')
+
+# Specific product management role keywords - a title must contain at least one
+_PRODUCT_KEYWORDS = (
+    'product manager',
+    'associate product manager',
+    'sr. product manager',
+    'senior product manager',
+    'principal product manager',
+    'staff product manager',
+    'product operations',
+    'product ops',
+    'product marketing manager',  # Include product marketing
+    'technical product manager',  # Include technical PM
+    'apm',  # Associate Product Manager
+    'spm',  # Senior Product Manager
+)
+
+# Exclusion keywords - skip jobs with these terms (non-product management)
+_EXCLUSION_KEYWORDS = (
+    'clinical',
+    'medical',
+    'healthcare',
+    'hospital',
+    'patient',
+    'nursing',
+    'therapy',
+    'pharmaceutical',
+    'education',
+    'academic',
+    'school',
+    'teaching',
+    'instructor',
+    'curriculum',
+    'construction',
+    'real estate',
+    'property management',
+    'facility',
+    'maintenance',
+    'janitorial',
+    'security guard',
+    'warehouse',
+    'logistics coordinator',
+    'driver',
+    'delivery',
+    'food service',
+    'restaurant',
+    'retail',
+    'sales associate',
+    'customer service rep',
+)
+
+# Additional positive signals in description (logged, not required)
+_POSITIVE_SIGNALS = (
+    'product strategy',
+    'product roadmap',
+    'user experience',
+    'product development',
+    'market research',
+    'product launch',
+    'feature',
+    'agile',
+    'scrum',
+    'stakeholder',
+    'kpi',
+    'metrics',
+    'a/b test',
+    'user story',
+    'mvp',
+    'saas',
+    'software',
+    'tech',
+    'startup',
+)
+
+
+def _keyword_re(keywords) -> re.Pattern:
+    """
+    Fuse a keyword list into one case-insensitive regex.
+    
+    Keywords match as whole words (a plural "s" is allowed), so short ones
+    like "apm" no longer hit inside unrelated words.
+    
+    Args:
+        keywords: Keywords or phrases to match
+    
+    Returns:
+        Compiled pattern; search() finds any of the keywords
+    """
+    return re.compile(r'\b(?:' + '|'.join(map(re.escape, keywords)) + r')s?\b', re.IGNORECASE)
+
+
+_PRODUCT_RE = _keyword_re(_PRODUCT_KEYWORDS)
+_EXCLUSION_RE = _keyword_re(_EXCLUSION_KEYWORDS)
+_POSITIVE_RE = _keyword_re(_POSITIVE_SIGNALS)
+
+# Job pages fetched concurrently (per city search) when looking up salaries
+MAX_SALARY_WORKERS = 4
+
+# Job page salary lookups are reused across cities and runs; pages without a
+# salary (or that failed to load) are rechecked sooner
+SALARY_CACHE_TTL_SECONDS = 24 * 3600
+SALARY_MISS_TTL_SECONDS = 3600
+
+# LinkedIn job ID in a job page URL (/jobs/view/<slug>-<id> or /jobs/view/<id>)
+_JOB_ID_RE = re.compile(r'/jobs/view/(?:[^/?#]*-)?(\d+)')
+
+
+def _job_page_key(job_url: str) -> str:
+    """Cache key for a job page: its LinkedIn job ID, or the URL without query string."""
+    match = _JOB_ID_RE.search(job_url)
+    return match.group(1) if match else job_url.split('?', 1)[0]
+
 
 class LinkedInJobMonitor:
     """Main LinkedIn job monitoring coordinator."""
@@ -35,6 +347,32 @@ class LinkedInJobMonitor:
         self.last_search_times = {}
         self.is_running = False
         
+        # Cities are searched concurrently; each worker thread gets its own
+        # keep-alive session since requests.Session isn't thread-safe
+        self._thread_local = threading.local()
+        
+        # Every session handed out, so cleanup can close their connections
+        self._sessions = []
+        self._sessions_lock = threading.Lock()
+        
+        # Recent search pages: URL -> (monotonic fetch time, HTML, validator
+        # headers). Fresh entries are reused for half a check interval, stale
+        # ones are revalidated with a conditional GET, and the last good page
+        # stands in when LinkedIn answers with an error (e.g. 429)
+        self._search_cache = {}
+        self._search_cache_ttl = self.config.check_interval_minutes * 60 / 2
+        
+        # Salary lookups run on a pool that lives as long as the monitor, so
+        # its threads' keep-alive sessions are reused across cities and runs
+        self._salary_executor = ThreadPoolExecutor(max_workers=MAX_SALARY_WORKERS, thread_name_prefix="salary-fetch")
+        
+        # New jobs get their job page salaries backfilled here, one batch at
+        # a time, after they have been sent to Discord
+        self._enrich_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="salary-enrich")
+        
+        # Job page salaries: job key (see _job_page_key) -> (monotonic expiry, result)
+        self._salary_cache = {}
+        
         logger.info("LinkedIn Job Monitor initialized")
     
     def initialize(self) -> bool:
@@ -50,199 +388,377 @@ class LinkedInJobMonitor:
             return True
             
         except Exception as e:
-            logger.error(f"Initialization failed: {e}")
+            logger.error("Initialization failed: %s", e)
             return False
     
-    def extract_jobs_http(self, city: str) -> Tuple[bool, List[Job]]:
+    def _get_session(self) -> requests.Session:
+        """Return the calling thread's HTTP session, creating it on first use."""
+        session = getattr(self._thread_local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            # Transient gateway errors and dropped connections are retried
+            # with a short backoff; 429s are left to the search page cache
+            session.mount('https://', HTTPAdapter(
+                pool_connections=2,
+                pool_maxsize=4,
+                max_retries=Retry(
+                    total=2,
+                    backoff_factor=0.3,
+                    status_forcelist=[502, 503, 504],
+                    raise_on_status=False
+                )
+            ))
+            self._thread_local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+    
+    def extract_jobs_http(self, city: str, window_minutes: int = 30) -> Tuple[bool, List[Job]]:
         """
         Extract jobs directly via HTTP requests to LinkedIn's guest API.
         
         Args:
             city: City code (NYC, LA, SF, SD, Remote)
+            window_minutes: Only include jobs posted within this many minutes
             
         Returns:
             Tuple of (success, list of new jobs found)
         """
-        logger.info(f"Starting HTTP job extraction for {city}")
+        success, jobs, search_url, error_message = self._search_city(city, window_minutes)
+        return success, self._record_search(city, success, jobs, search_url, error_message)
+    
+    def _search_city(self, city: str, window_minutes: int = 30,
+                     not_before: Optional[float] = None) -> Tuple[bool, List[Job], Optional[str], Optional[str]]:
+        """
+        Fetch and parse LinkedIn search results for a city.
+        
+        Makes no database calls, so several cities can be searched
+        concurrently on worker threads.
+        
+        Args:
+            city: City code (NYC, LA, SF, SD, Remote)
+            window_minutes: Only include jobs posted within this many minutes
+            not_before: Monotonic time before which LinkedIn must not be requested
+        
+        Returns:
+            Tuple of (success, jobs parsed, search URL, error message)
+        """
+        logger.info("Starting HTTP job extraction for %s", city)
+        search_url = None
         
         try:
             # Build LinkedIn guest API URL
-            location_ids = {
-                'NYC': '90000070',   # New York City Area
-                'LA': '90000049',    # Los Angeles Area  
-                'SF': '90000084',    # San Francisco Bay Area
-                'SD': '90010472',    # San Diego Area
-                'REMOTE': '90000072' # Remote (using US as fallback)
-            }
-            
-            location_id = location_ids.get(city.upper())
+            city_key = city.upper()
+            location_id = _LOCATION_IDS.get(city_key)
             if not location_id:
-                logger.error(f"Unknown city: {city}. Available cities: {list(location_ids.keys())}")
-                return False, []
+                logger.error("Unknown city: %s. Available cities: %s", city, list(_LOCATION_IDS.keys()))
+                return False, [], None, f"Unknown city: {city}"
+            remote_only = city_key == 'REMOTE'
             
             # LinkedIn jobs search URL - exact format as manual browsing (lowercase keywords, same parameter order)
-            keywords_lowercase = self.config.job_title.lower()
-            search_url = f"https://www.linkedin.com/jobs/search/?f_TPR=r1800&geoId={location_id}&keywords={quote(keywords_lowercase)}&origin=JOB_SEARCH_PAGE_LOCATION_AUTOCOMPLETE&start=0"
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
+            params = {
+                'f_TPR': f"r{window_minutes * 60}",
+                'geoId': location_id,
+                'keywords': self.config.job_title.lower(),
+                'origin': 'JOB_SEARCH_PAGE_LOCATION_AUTOCOMPLETE',
+                'start': 0
             }
+            search_url = f"https://www.linkedin.com/jobs/search/?{urlencode(params, quote_via=quote_plus)}"
             
-            logger.info(f"Fetching jobs from: {search_url}")
-            response = requests.get(search_url, headers=headers, timeout=15)
+            html, error_msg = self._fetch_search_page(search_url, _SEARCH_HEADERS, not_before)
+            if html is None:
+                return False, [], search_url, error_msg
             
-            if response.status_code != 200:
-                error_msg = f"HTTP {response.status_code}"
-                logger.error(error_msg)
-                self.database.log_search(city, search_url, success=False, error_message=error_msg)
-                return False, []
-            
-            logger.info(f"Got {len(response.text)} chars of HTML")
-            
-            # Parse HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
+            logger.info("Got %s bytes of HTML", len(html))
             
-            # Find job cards
-            job_cards = soup.find_all('div', class_='job-search-card')
-            logger.info(f"Found {len(job_cards)} job cards")
+            # Stream the page into job card records
+            job_cards, card_count = _parse_job_cards(html)
+            logger.info("Found %s job cards, %s mention a product role", card_count, len(job_cards))
             
-            jobs = []
-            for i, card in enumerate(job_cards):
+            # First pass: read each card's fields and keep relevant jobs
+            listings = []
+            for i, fields in enumerate(job_cards):
                 try:
                     # Extract job data
-                    title_elem = card.find('h3', class_='base-search-card__title')
-                    title = title_elem.get_text().strip() if title_elem else ''
+                    title = fields.get('title', '').strip()
+                    company = fields.get('company', '').strip()
+                    
+                    # Skip the job if essential data is missing
+                    if not title or not company:
+                        continue
                     
-                    company_elem = card.find('h4', class_='base-search-card__subtitle')
-                    company = company_elem.get_text().strip() if company_elem else ''
+                    # Extract job description/summary if available
+                    description = (fields.get('snippet') or fields.get('snippet_div') or '').strip()
+                    
+                    # Filter for relevant product management jobs only, before
+                    # reading the fields that only kept jobs need
+                    if not self._is_relevant_product_job(title, description):
+                        logger.debug("Skipping irrelevant job: %s at %s", title, company)
+                        continue
+                    
+                    location = fields.get('location', '').strip()
+                    
+                    # Determine location type
+                    location_lower = location.lower()
+                    if 'remote' in location_lower:
+                        location_type = 'Remote'
+                    elif 'hybrid' in location_lower:
+                        location_type = 'Hybrid'
+                    else:
+                        location_type = 'On-site'
                     
-                    location_elem = card.find('span', class_='job-search-card__location')
-                    location = location_elem.get_text().strip() if location_elem else ''
+                    # Filter jobs based on city search criteria: a Remote search
+                    # only keeps jobs that are actually remote
+                    if remote_only and location_type != 'Remote':
+                        logger.debug("Skipping non-remote job in Remote search: %s at %s (%s)", title, company, location_type)
+                        continue
                     
                     # Extract job URL
-                    link_elem = card.find('a', class_='base-card__full-link')
-                    job_url = link_elem.get('href') if link_elem else ''
+                    job_url = fields.get('link', '')
                     
                     # Extract salary if available
-                    salary_elem = card.find('span', class_='job-search-card__salary-info')
-                    salary = salary_elem.get_text().strip() if salary_elem else ''
-                    
-                    # Extract job description/summary if available
-                    desc_elem = card.find('p', class_='job-search-card__snippet') or card.find('div', class_='job-search-card__snippet')
-                    description = desc_elem.get_text().strip() if desc_elem else ''
+                    salary = fields.get('salary', '').strip()
                     
                     # Extract posted time
-                    time_elem = card.find('time')
-                    posted_time = time_elem.get_text().strip() if time_elem else ''
+                    posted_time = fields.get('time', '').strip()
                     
-                    # Create job object if we have essential data
-                    if title and company:
-                        # Filter for relevant product management jobs only
-                        if not self._is_relevant_product_job(title, description):
-                            logger.debug(f"Skipping irrelevant job: {title} at {company}")
-                            continue
-                        
-                        # Generate company career page URL
-                        company_career_url = None
-                        if company:
-                            search_query = quote(f"{company} {title} careers")
-                            company_career_url = f"https://www.google.com/search?q={search_query}"
-                        
-                        # Determine location type
-                        location_type = 'On-site'
-                        if 'remote' in location.lower():
-                            location_type = 'Remote'
-                        elif 'hybrid' in location.lower():
-                            location_type = 'Hybrid'
-                        
-                        # Extract salary information from job page (if available)
-                        pay_range_min = None
-                        pay_range_max = None
-                        final_salary_text = salary
-                        
-                        # Try to get salary from individual job page if job URL exists
-                        if job_url and 'linkedin.com' in job_url:
-                            page_salary, page_min, page_max = self._extract_salary_from_job_page(job_url)
-                            if page_salary:
-                                final_salary_text = page_salary
-                                pay_range_min = page_min
-                                pay_range_max = page_max
-                        
-                        # Fallback: Check description for salary info if not found elsewhere
-                        if not final_salary_text and description:
-                            desc_salary = self._extract_salary_from_description(description)
-                            if desc_salary:
-                                final_salary_text = desc_salary
-                                # Extract numeric values from description salary
-                                import re
-                                numbers = re.findall(r'\$([\d,]+)', final_salary_text)
-                                if len(numbers) >= 2:
-                                    pay_range_min = int(numbers[0].replace(',', ''))
-                                    pay_range_max = int(numbers[1].replace(',', ''))
-                                elif len(numbers) == 1:
-                                    pay_range_min = int(numbers[0].replace(',', ''))
-                        
-                        job = Job(
-                            title=title,
-                            company=company,
-                            location=location,
-                            location_type=location_type,
-                            pay_range_text=final_salary_text if final_salary_text else None,
-                            pay_range_min=pay_range_min,
-                            pay_range_max=pay_range_max,
-                            posted_time=posted_time,
-                            linkedin_url=job_url,
-                            company_career_url=company_career_url,
-                            city=city
-                        )
+                    listings.append((i, title, company, location, location_type, job_url, salary, description, posted_time))
+                    
+                except Exception as e:
+                    logger.warning("Error parsing job %s: %s", i+1, e)
+                    continue
+            
+            # Build Job objects; salaries on the job pages are fetched in the
+            # background once new jobs have been notified (see _enrich_salaries)
+            jobs = []
+            for i, title, company, location, location_type, job_url, salary, description, posted_time in listings:
+                try:
+                    # Generate company career page URL (every kept job has a company)
+                    company_career_url = f"https://www.google.com/search?q={quote_plus(f'{company} {title} careers')}"
                         
-                        # Filter jobs based on city search criteria
-                        should_include = True
-                        if city.upper() == 'REMOTE':
-                            # Only include jobs that are actually remote
-                            if location_type != 'Remote':
-                                should_include = False
-                                logger.debug(f"Skipping non-remote job in Remote search: {title} at {company} ({location_type})")
+                    # Salary information from the job card (if available)
+                    pay_range_min = None
+                    pay_range_max = None
+                    final_salary_text = salary
                         
-                        if should_include:
-                            jobs.append(job)
-                            logger.info(f"Extracted job {i+1}: {title} at {company}")
-                        else:
-                            logger.debug(f"Filtered out job {i+1}: {title} at {company} - doesn't match {city} criteria")
+                    # Fallback: Check description for salary info if not found elsewhere
+                    if not final_salary_text and description:
+                        desc_salary = self._extract_salary_from_description(description)
+                        if desc_salary:
+                            final_salary_text = desc_salary
+                            # Extract numeric values from description salary
+                            numbers = _SALARY_NUMBERS_RE.findall(final_salary_text)
+                            if len(numbers) >= 2:
+                                pay_range_min = int(numbers[0].replace(',', ''))
+                                pay_range_max = int(numbers[1].replace(',', ''))
+                            elif len(numbers) == 1:
+                                pay_range_min = int(numbers[0].replace(',', ''))
+                    
+                    job = Job(
+                        title=title,
+                        company=company,
+                        location=location,
+                        location_type=location_type,
+                        pay_range_text=final_salary_text if final_salary_text else None,
+                        pay_range_min=pay_range_min,
+                        pay_range_max=pay_range_max,
+                        posted_time=posted_time,
+                        linkedin_url=job_url,
+                        company_career_url=company_career_url,
+                        city=city
+                    )
+                    
+                    jobs.append(job)
+                    logger.info("Extracted job %s: %s at %s", i+1, title, company)
                     
                 except Exception as e:
-                    logger.warning(f"Error parsing job {i+1}: {e}")
+                    logger.warning("Error parsing job %s: %s", i+1, e)
                     continue
             
-            # Add jobs to database and identify new ones
-            new_jobs = []
-            for job in jobs:
-                is_new_job = self.database.add_job(job)
-                if is_new_job:
-                    new_jobs.append(job)
-                    logger.info(f"New job found: {job.title} at {job.company}")
-                else:
-                    logger.debug(f"Job already exists: {job.title} at {job.company}")
-            
-            # Log search results
-            self.database.log_search(
-                city=city,
-                search_url=search_url,
-                jobs_found=len(new_jobs),
-                success=True
+            return True, jobs, search_url, None
+            
+        except Exception as e:
+            logger.error("Error during HTTP extraction for %s: %s", city, e)
+            return False, [], search_url, str(e)
+    
+    def _fetch_search_page(self, search_url: str, headers: Dict[str, str],
+                           not_before: Optional[float] = None) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        Fetch a LinkedIn search page, going through the in-process response cache.
+        
+        A stale cached page is revalidated with If-None-Match/If-Modified-Since
+        when LinkedIn sent an ETag or Last-Modified for it; a 304 reuses the
+        cached body instead of downloading the page again.
+        
+        Args:
+            search_url: LinkedIn search URL
+            headers: Request headers
+            not_before: Monotonic time before which LinkedIn must not be requested;
+                cache hits don't wait for it
+        
+        Returns:
+            Tuple of (raw html, error_message) - html is None if nothing usable was fetched.
+            The html is the undecoded body; the parser works out its encoding
+        """
+        cached = self._search_cache.get(search_url)
+        if cached and time.monotonic() - cached[0] < self._search_cache_ttl:
+            logger.info("Using cached search page for: %s", search_url)
+            return cached[1], None
+        
+        # Staggered start so concurrent city searches don't hit LinkedIn at once
+        if not_before is not None:
+            delay = not_before - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        
+        if cached and cached[2]:
+            headers = {**headers, **cached[2]}
+        
+        logger.info("Fetching jobs from: %s", search_url)
+        response = self._get_session().get(search_url, headers=headers, timeout=15)
+        
+        # The cached body is still returned and parsed, so callers such as
+        # search_cities get the same jobs they would from a 200; parsing is
+        # cheap, and add_jobs drops already known jobs without a transaction
+        if response.status_code == 304 and cached:
+            logger.info("Search page not modified since last fetch: %s", search_url)
+            self._search_cache[search_url] = (time.monotonic(), cached[1], cached[2])
+            return cached[1], None
+        
+        if response.status_code != 200:
+            error_msg = f"HTTP {response.status_code}"
+            if cached:
+                logger.warning("%s from LinkedIn - falling back to cached search page", error_msg)
+                return cached[1], None
+            logger.error(error_msg)
+            return None, error_msg
+        
+        validators = {}
+        if response.headers.get('ETag'):
+            validators['If-None-Match'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            validators['If-Modified-Since'] = response.headers['Last-Modified']
+        
+        self._search_cache[search_url] = (time.monotonic(), response.content, validators)
+        return response.content, None
+    
+    def _record_search(self, city: str, success: bool, jobs: List[Job],
+                       search_url: Optional[str], error_message: Optional[str]) -> List[Job]:
+        """
+        Store parsed jobs and log the search attempt.
+        
+        Args:
+            city: City code the search was run for
+            success: Whether the search succeeded
+            jobs: Jobs parsed from the search results
+            search_url: URL that was searched (None if no request was made)
+            error_message: Error description for failed searches
+        
+        Returns:
+            List of jobs not seen before
+        """
+        if search_url is None:
+            return []
+        
+        if not success:
+            self.database.log_search(city, search_url, success=False, error_message=error_message)
+            return []
+        
+        # Add jobs to database in one transaction and identify new ones
+        new_jobs = self.database.add_jobs(jobs)
+        for job in new_jobs:
+            logger.info("New job found: %s at %s", job.title, job.company)
+        logger.debug("%s jobs already existed", len(jobs) - len(new_jobs))
+        
+        # Log search results
+        self.database.log_search(
+            city=city,
+            search_url=search_url,
+            jobs_found=len(new_jobs),
+            success=True
+        )
+        
+        logger.info("HTTP extraction completed for %s. Found %s new jobs out of %s processed", city, len(new_jobs), len(jobs))
+        return new_jobs
+    
+    def _enrich_salaries(self, jobs: List[Job]) -> int:
+        """
+        Backfill stored jobs with the salary shown on their LinkedIn job page.
+        
+        Runs on the enrichment thread after the jobs have been notified, so
+        the extra request per job never delays a notification.
+        
+        Args:
+            jobs: Newly stored jobs
+        
+        Returns:
+            Number of jobs updated
+        """
+        try:
+            # Drop expired salary lookups; only this thread touches the cache
+            now = time.monotonic()
+            self._salary_cache = {key: entry for key, entry in self._salary_cache.items() if entry[0] > now}
+            
+            page_salaries = self._fetch_job_page_salaries(
+                [job.linkedin_url for job in jobs if job.linkedin_url and 'linkedin.com' in job.linkedin_url]
             )
             
-            logger.info(f"HTTP extraction completed for {city}. Found {len(new_jobs)} new jobs out of {len(jobs)} processed")
-            return True, new_jobs
+            updates = []
+            for job in jobs:
+                page_salary, page_min, page_max = page_salaries.get(job.linkedin_url, ("", None, None))
+                if page_salary and page_salary != job.pay_range_text:
+                    job.pay_range_text, job.pay_range_min, job.pay_range_max = page_salary, page_min, page_max
+                    updates.append((job.job_hash, page_salary, page_min, page_max))
+            
+            updated = self.database.update_job_salaries(updates)
+            logger.info("💰 Backfilled salaries for %s of %s new jobs", updated, len(jobs))
+            return updated
             
+        except CancelledError:
+            logger.info("Salary backfill cancelled by shutdown")
+            return 0
         except Exception as e:
-            logger.error(f"Error during HTTP extraction for {city}: {e}")
-            self.database.log_search(city, search_url or "", success=False, error_message=str(e))
-            return False, []
+            logger.error("Error backfilling job salaries: %s", e)
+            return 0
+    
+    def _fetch_job_page_salaries(self, job_urls: List[str]) -> Dict[str, Tuple[str, int, int]]:
+        """
+        Fetch salary information from several job pages concurrently.
+        
+        Args:
+            job_urls: LinkedIn job URLs
+        
+        Returns:
+            Mapping of job URL to (salary_text, min_salary, max_salary)
+        """
+        keys = {job_url: _job_page_key(job_url) for job_url in job_urls}
+        
+        # Reuse lookups from other cities and earlier runs
+        now = time.monotonic()
+        salaries = {}
+        for key in set(keys.values()):
+            cached = self._salary_cache.get(key)
+            if cached and cached[0] > now:
+                salaries[key] = cached[1]
+        
+        missing = {}
+        for job_url, key in keys.items():
+            if key not in salaries:
+                missing.setdefault(key, job_url)
+        
+        if missing:
+            logger.debug("Fetching %s job pages for salaries (%s cached)", len(missing), len(salaries))
+            
+            # Bounded so a page of results doesn't open a burst of connections to LinkedIn
+            fetched = dict(zip(missing, self._salary_executor.map(self._extract_salary_from_job_page, missing.values())))
+            
+            now = time.monotonic()
+            for key, result in fetched.items():
+                ttl = SALARY_CACHE_TTL_SECONDS if result[0] else SALARY_MISS_TTL_SECONDS
+                self._salary_cache[key] = (now + ttl, result)
+            salaries.update(fetched)
+        
+        return {job_url: salaries[key] for job_url, key in keys.items()}
     
     def _extract_salary_from_job_page(self, job_url: str) -> Tuple[str, int, int]:
         """
@@ -255,18 +771,14 @@ class LinkedInJobMonitor:
             Tuple of (salary_text, min_salary, max_salary)
         """
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            }
-            
-            logger.debug(f"Fetching salary data from job page: {job_url}")
-            response = requests.get(job_url, headers=headers, timeout=10)
+            logger.debug("Fetching salary data from job page: %s", job_url)
+            response = self._get_session().get(job_url, headers=_JOB_PAGE_HEADERS, timeout=10)
             
             if response.status_code != 200:
-                logger.debug(f"Failed to fetch job page: {response.status_code}")
+                logger.debug("Failed to fetch job page: %s", response.status_code)
                 return "", None, None
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, _HTML_PARSER)
             
             # Look for salary information in job page
             salary_elem = soup.find('span', class_='main-job-card__salary-info')
@@ -276,8 +788,7 @@ class LinkedInJobMonitor:
                 salary_text = ' '.join(salary_text.split())
                 
                 # Extract numeric values
-                import re
-                numbers = re.findall(r'\$([0-9,]+)', salary_text)
+                numbers = _SALARY_NUMBERS_RE.findall(salary_text)
                 if len(numbers) >= 2:
                     min_salary = int(numbers[0].replace(',', ''))
                     max_salary = int(numbers[1].replace(',', ''))
@@ -291,40 +802,18 @@ class LinkedInJobMonitor:
             return "", None, None
             
         except Exception as e:
-            logger.debug(f"Error extracting salary from job page: {e}")
+            logger.debug("Error extracting salary from job page: %s", e)
             return "", None, None
     
     def _extract_salary_from_description(self, description: str) -> str:
         """Extract salary information from job description text."""
-        import re
-        
-        # Common salary patterns in job descriptions
-        salary_patterns = [
-            # $80,000 - $120,000
-            r'\$[\d,]+\s*[-–—]\s*\$[\d,]+',
-            # $80K - $120K
-            r'\$[\d,]+k?\s*[-–—]\s*\$[\d,]+k?',
-            # 80k - 120k
-            r'[\d,]+k?\s*[-–—]\s*[\d,]+k?(?:\s*(?:per\s+year|annually|salary))?',
-            # Salary: $80,000
-            r'(?:salary|compensation|pay):\s*\$[\d,]+',
-            # Up to $120,000
-            r'up\s+to\s+\$[\d,]+',
-            # Starting at $80,000
-            r'starting\s+(?:at|from)\s+\$[\d,]+',
-            # $25-35/hour or $25-35 per hour
-            r'\$[\d,]+\s*[-–—]\s*\$?[\d,]+\s*(?:/|\s+per\s+)hour',
-            # Hourly rate: $25
-            r'(?:hourly\s+rate|per\s+hour):\s*\$[\d,]+',
-        ]
-        
-        for pattern in salary_patterns:
-            matches = re.findall(pattern, description, re.IGNORECASE)
-            if matches:
+        for pattern in _SALARY_PATTERNS:
+            match = pattern.search(description)
+            if match:
                 # Return the first match, cleaned up
-                salary_text = matches[0].strip()
+                salary_text = match.group().strip()
                 # Add $ prefix if missing for number-only ranges like "80k - 120k"
-                if not salary_text.startswith('$') and re.match(r'\d', salary_text):
+                if not salary_text.startswith('$') and salary_text[:1].isdecimal():
                     salary_text = f"${salary_text}"
                 return salary_text
         
@@ -345,156 +834,114 @@ class LinkedInJobMonitor:
             return False
         
         title_lower = title.lower()
-        desc_lower = description.lower() if description else ""
-        
-        # Specific product management role keywords - must contain at least one
-        product_keywords = [
-            'product manager',
-            'associate product manager',
-            'sr. product manager',
-            'senior product manager', 
-            'principal product manager',
-            'staff product manager',
-            'product operations',
-            'product ops',
-            'product marketing manager',  # Include product marketing
-            'technical product manager',  # Include technical PM
-            'apm',  # Associate Product Manager
-            'spm',  # Senior Product Manager
-        ]
         
         # Check if title contains specific product management keywords
-        has_product_keyword = any(keyword in title_lower for keyword in product_keywords)
+        has_product_keyword = _PRODUCT_RE.search(title_lower) is not None
         
         if not has_product_keyword:
             return False
         
-        # Exclusion keywords - skip jobs with these terms (non-product management)
-        exclusion_keywords = [
-            'clinical',
-            'medical', 
-            'healthcare',
-            'hospital',
-            'patient',
-            'nursing',
-            'therapy',
-            'pharmaceutical',
-            'education',
-            'academic',
-            'school',
-            'teaching',
-            'instructor',
-            'curriculum',
-            'construction',
-            'real estate',
-            'property management',
-            'facility',
-            'maintenance',
-            'janitorial',
-            'security guard',
-            'warehouse',
-            'logistics coordinator',
-            'driver',
-            'delivery',
-            'food service',
-            'restaurant',
-            'retail',
-            'sales associate',
-            'customer service rep',
-        ]
+        desc_lower = description.lower() if description else ""
         
         # Check for exclusions in both title and description
         text_to_check = f"{title_lower} {desc_lower}"
-        has_exclusion = any(keyword in text_to_check for keyword in exclusion_keywords)
+        has_exclusion = _EXCLUSION_RE.search(text_to_check) is not None
         
         if has_exclusion:
             return False
         
-        # Additional positive signals in description
-        positive_signals = [
-            'product strategy',
-            'product roadmap', 
-            'user experience',
-            'product development',
-            'market research',
-            'product launch',
-            'feature',
-            'agile',
-            'scrum',
-            'stakeholder',
-            'kpi',
-            'metrics',
-            'a/b test',
-            'user story',
-            'mvp',
-            'saas',
-            'software',
-            'tech',
-            'startup',
-        ]
-        
-        # Bonus points for positive signals, but not required
-        has_positive_signal = any(signal in desc_lower for signal in positive_signals)
-        
-        # Log the decision for debugging
-        logger.debug(f"Job filtering - '{title}': product_keyword={has_product_keyword}, exclusion={has_exclusion}, positive_signal={has_positive_signal}")
+        # Bonus points for positive signals, but not required - only ever
+        # logged, so don't scan for them unless debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            has_positive_signal = _POSITIVE_RE.search(desc_lower) is not None
+            logger.debug("Job filtering - '%s': product_keyword=%s, exclusion=%s, positive_signal=%s", title, has_product_keyword, has_exclusion, has_positive_signal)
         
         return True  # Passed all filters
     
-    def find_and_notify_jobs(self) -> int:
+    def search_cities(self, cities: List[str], window_minutes: int = 30) -> List[Tuple[bool, List[Job], Optional[str], Optional[str]]]:
         """
-        Find all new jobs from past 30 minutes, sort by location, and send to correct webhooks.
+        Search several cities concurrently without touching the database.
+        
+        The searches are network-bound, so a small pool cuts total time well
+        below the sum of all cities. Nothing is stored or logged to search
+        history, so diagnostics can use this without marking jobs as seen.
+        
+        Args:
+            cities: City codes to search
+            window_minutes: Only include jobs posted within this many minutes
+        
+        Returns:
+            One (success, jobs parsed, search URL, error message) tuple per city, in order
+        """
+        if not cities:
+            return []
+        
+        # Each city's request is scheduled a random delay after the
+        # previous one; workers wait for their slot rather than this
+        # thread sleeping between submits, and cached pages skip it
+        not_before = time.monotonic()
+        with ThreadPoolExecutor(max_workers=min(MAX_SEARCH_WORKERS, len(cities))) as executor:
+            futures = []
+            for i, city in enumerate(cities):
+                if i:
+                    not_before += random.uniform(*SEARCH_JITTER_SECONDS)
+                futures.append(executor.submit(self._search_city, city, window_minutes, not_before))
+            return [future.result() for future in futures]
+    
+    def find_and_notify_jobs(self, window_minutes: int = 30) -> int:
+        """
+        Find all new jobs from the past window, sort by location, and send to correct webhooks.
+        
+        Args:
+            window_minutes: Only include jobs posted within this many minutes
         
         Returns:
             Total number of jobs found and sent
         """
         logger.info("=" * 60)
-        logger.info("FINDING JOBS FROM PAST 30 MINUTES")
+        logger.info("FINDING JOBS FROM PAST %s MINUTES", window_minutes)
         logger.info("=" * 60)
         
         all_jobs_by_city = {}
         total_jobs_found = 0
+        cities = list(self.config.cities)
         
-        # Search each city for jobs posted in last 30 minutes
-        for city in self.config.cities:
-            logger.info(f"🔍 Searching {city} for jobs posted in last 30 minutes...")
+        logger.info("🔍 Searching %s for jobs posted in last %s minutes...", ', '.join(cities), window_minutes)
+        search_results = self.search_cities(cities, window_minutes)
             
-            success, new_jobs = self.extract_jobs_http(city)
+        # Database writes stay on this thread
+        for city, (success, jobs, search_url, error_message) in zip(cities, search_results):
+            new_jobs = self._record_search(city, success, jobs, search_url, error_message)
             if success and new_jobs:
                 all_jobs_by_city[city] = new_jobs
                 total_jobs_found += len(new_jobs)
-                logger.info(f"✅ Found {len(new_jobs)} new jobs in {city}")
+                logger.info("✅ Found %s new jobs in %s", len(new_jobs), city)
             else:
-                logger.info(f"📭 No new jobs found in {city}")
-            
-            # Small delay between cities
-            time.sleep(2)
+                logger.info("📭 No new jobs found in %s", city)
         
         # Send notifications to city-specific webhooks
         if total_jobs_found > 0:
-            logger.info(f"📨 Sending {total_jobs_found} jobs to Discord webhooks...")
+            logger.info("📨 Sending %s jobs to Discord webhooks...", total_jobs_found)
+            
+            # Jobs are batched per webhook (up to 10 embeds per message)
+            results = self.discord.notify_jobs(all_jobs_by_city)
             
             for city, jobs in all_jobs_by_city.items():
-                if jobs:
-                    logger.info(f"Sending {len(jobs)} jobs to {city} webhook")
-                    
-                    # Send jobs to city-specific webhook
-                    if len(jobs) == 1:
-                        success = self.discord.notify_new_job(jobs[0])
-                    else:
-                        success = self.discord.notify_multiple_jobs(jobs, city)
-                    
-                    if success:
-                        # Mark jobs as notified
-                        for job in jobs:
-                            self.database.mark_job_notified(job.job_hash)
-                        logger.info(f"✅ Sent {len(jobs)} jobs to {city} Discord channel")
-                    else:
-                        logger.warning(f"❌ Failed to send jobs to {city} Discord channel")
+                if results.get(city):
+                    # Mark jobs as notified
+                    self.database.mark_jobs_notified([job.job_hash for job in jobs])
+                    logger.info("✅ Sent %s jobs to %s Discord channel", len(jobs), city)
+                else:
+                    logger.warning("❌ Failed to send jobs to %s Discord channel", city)
+            
+            # Salaries from the job pages are looked up off the critical path
+            self._enrich_executor.submit(self._enrich_salaries, [
+                job for jobs in all_jobs_by_city.values() for job in jobs
+            ])
         else:
             logger.info("📭 No new jobs found in any city - nothing to send")
         
-        logger.info(f"🎯 TOTAL: Found and sent {total_jobs_found} jobs")
+        logger.info("🎯 TOTAL: Found and sent %s jobs", total_jobs_found)
         return total_jobs_found
 
     
@@ -516,7 +963,7 @@ class LinkedInJobMonitor:
             return stats
             
         except Exception as e:
-            logger.error(f"Error getting stats: {e}")
+            logger.error("Error getting stats: %s", e)
             return {'error': str(e)}
     
     def send_daily_summary(self):
@@ -528,16 +975,24 @@ class LinkedInJobMonitor:
             self.discord.notify_daily_summary(stats)
             
         except Exception as e:
-            logger.error(f"Error sending daily summary: {e}")
+            logger.error("Error sending daily summary: %s", e)
     
     def cleanup(self):
         """Clean up resources."""
         logger.info("Cleaning up LinkedIn Job Monitor")
         
         try:
+            # Don't wait on pending job page fetches; their salaries are
+            # only a backfill
+            self._enrich_executor.shutdown(wait=False, cancel_futures=True)
+            self._salary_executor.shutdown(wait=False, cancel_futures=True)
+            with self._sessions_lock:
+                sessions, self._sessions = self._sessions, []
+            for session in sessions:
+                session.close()
             self.database.close()
         except Exception as e:
-            logger.error(f"Error during cleanup: {e}")
+            logger.error("Error during cleanup: %s", e)
     
     def __enter__(self):
         """Context manager entry."""
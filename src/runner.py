@@ -0,0 +1,53 @@
+"""
+Search cycle runner for LinkedIn Job Monitor
+
+One implementation of a find-and-notify cycle, shared by every entry point
+that runs a job search (scheduled ticks, manual triggers, startup search).
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Callable, Dict, Optional
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+def run_search_cycle(monitor, window_minutes: Optional[int] = None,
+                     on_result: Optional[Callable[[Dict], None]] = None) -> Dict:
+    """
+    Run one search cycle: find new jobs in every city and send them to Discord.
+    
+    Args:
+        monitor: LinkedInJobMonitor to search with
+        window_minutes: How far back to search (defaults to the check interval)
+        on_result: Optional callback invoked with the result dict once the cycle ends
+        
+    Returns:
+        Result dict with jobs_found, success, timestamp and duration_s
+        (plus error when the cycle failed)
+    """
+    started = datetime.now(timezone.utc)
+    
+    try:
+        jobs_found = monitor.find_and_notify_jobs(
+            window_minutes or monitor.config.check_interval_minutes
+        )
+        result = {
+            'jobs_found': jobs_found,
+            'success': True,
+            'timestamp': started.isoformat()
+        }
+    except Exception as e:
+        logger.error("❌ ERROR during job search: %s", e)
+        result = {
+            'jobs_found': 0,
+            'success': False,
+            'error': str(e),
+            'timestamp': started.isoformat()
+        }
+    
+    result['duration_s'] = (datetime.now(timezone.utc) - started).total_seconds()
+    
+    if on_result:
+        on_result(result)
+    return result